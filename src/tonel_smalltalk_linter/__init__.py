@@ -4,7 +4,8 @@ A linter for Tonel Smalltalk files that checks for best practices
 and code quality issues.
 """
 
+from .cache import LintCache
 from .linter import LintIssue, TonelLinter
 
 __version__ = "0.1.0"
-__all__ = ["LintIssue", "TonelLinter"]
+__all__ = ["LintCache", "LintIssue", "TonelLinter"]
@@ -0,0 +1,163 @@
+"""Persistent on-disk cache of lint results.
+
+Lint results are stored in a SQLite database keyed by file path, the linter
+that produced them (class and package version) and the SHA-256 digest of the
+file content, so unchanged files can skip parsing entirely on repeated linter
+runs. Issues are stored as JSON arrays of plain
+values, never pickled, so a cache file from an untrusted checkout cannot run
+code when it is read.
+"""
+
+import hashlib
+from importlib import metadata
+import json
+from pathlib import Path
+import sqlite3
+import sys
+
+from .linter import LintIssue
+
+DEFAULT_CACHE_FILE = ".tonel_lint_cache.sqlite"
+
+# Bump whenever the table or LintIssue layout change so stale entries are
+# dropped; lint rule changes are covered by the package version in linter_key
+CACHE_VERSION = 4
+
+try:
+    _PACKAGE_VERSION = metadata.version("tonel-smalltalk-parser")
+except metadata.PackageNotFoundError:
+    _PACKAGE_VERSION = "unknown"
+
+
+class LintCache:
+    """SQLite-backed cache mapping (path, linter, sha256(content)) to issues.
+
+    Opening raises sqlite3.Error if the database cannot be used. Once open,
+    read failures count as misses, and the first write failure prints a
+    warning to stderr and turns later writes into no-ops, so a locked or
+    read-only cache never aborts a lint run.
+
+    Args:
+        cache_path: Path of the SQLite database file
+
+    """
+
+    def __init__(self, cache_path: Path | str = DEFAULT_CACHE_FILE):
+        self.cache_path = str(cache_path)
+        self.writable = True
+        self.connection = sqlite3.connect(self.cache_path)
+        try:
+            version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+            if version != CACHE_VERSION:
+                self.connection.execute("DROP TABLE IF EXISTS ast")
+                self.connection.execute(f"PRAGMA user_version = {CACHE_VERSION}")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS ast "
+                "(path TEXT, linter TEXT, sha BLOB, issues BLOB, "
+                "PRIMARY KEY (path, linter))"
+            )
+        except sqlite3.Error:
+            self.connection.close()
+            raise
+
+    @staticmethod
+    def digest(content: bytes) -> bytes:
+        """Return the SHA-256 digest used as the content key."""
+        return hashlib.sha256(content).digest()
+
+    @staticmethod
+    def linter_key(linter: object) -> str:
+        """Return the key identifying the rule set that produced cached issues.
+
+        Subclasses overriding checks, and package upgrades changing the
+        built-in rules, get separate entries instead of each other's results.
+        """
+        linter_class = type(linter)
+        return (
+            f"{linter_class.__module__}.{linter_class.__qualname__}@{_PACKAGE_VERSION}"
+        )
+
+    def get(self, path: Path | str, sha: bytes, linter: str) -> list[LintIssue] | None:
+        """Return cached issues for path if its content digest still matches.
+
+        Args:
+            path: Path of the linted file
+            sha: SHA-256 digest of the current file content
+            linter: Key of the linter asking, from linter_key
+
+        Returns:
+            list[LintIssue] | None: Cached issues, or None on a cache miss
+
+        """
+        try:
+            row = self.connection.execute(
+                "SELECT sha, issues FROM ast WHERE path = ? AND linter = ?",
+                (str(path), linter),
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None or row[0] != sha:
+            return None
+        try:
+            return [LintIssue(*fields) for fields in json.loads(row[1])]
+        except (ValueError, TypeError):
+            return None
+
+    def put(
+        self,
+        path: Path | str,
+        sha: bytes,
+        issues: list[LintIssue],
+        linter: str,
+    ) -> None:
+        """Store issues for path; written to disk on the next commit().
+
+        Args:
+            path: Path of the linted file
+            sha: SHA-256 digest of the linted file content
+            issues: Issues found in the file
+            linter: Key of the linter that found them, from linter_key
+
+        """
+        if not self.writable:
+            return
+        rows = [
+            (
+                issue.severity,
+                issue.message,
+                issue.class_name,
+                issue.selector,
+                issue.is_class_method,
+            )
+            for issue in issues
+        ]
+        try:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO ast (path, linter, sha, issues) "
+                "VALUES (?, ?, ?, ?)",
+                (str(path), linter, sha, json.dumps(rows)),
+            )
+        except sqlite3.Error as e:
+            self._disable_writes(e)
+
+    def commit(self) -> None:
+        """Commit all pending writes in a single transaction."""
+        if not self.writable:
+            return
+        try:
+            self.connection.commit()
+        except sqlite3.Error as e:
+            self._disable_writes(e)
+
+    def _disable_writes(self, error: sqlite3.Error) -> None:
+        """Warn about a failed write and skip all further writes."""
+        self.writable = False
+        print(
+            f"Warning: cannot write lint cache {self.cache_path}: {error}",
+            file=sys.stderr,
+        )
+
+    def close(self) -> None:
+        """Commit pending writes and close the database."""
+        self.commit()
+        self.connection.close()
@@ -5,11 +5,68 @@ This module provides CLI commands for linting Tonel files.
 """
 
 import argparse
+from collections.abc import Iterator
+import os
 from pathlib import Path
+import re
+import sqlite3
 import sys
 
+from .cache import DEFAULT_CACHE_FILE, LintCache
 from .linter import TonelLinter
 
+# Number of leading bytes inspected by _looks_like_tonel
+HEADER_SIZE = 4096
+
+# A Tonel file starts with its class comment or its definition
+_TONEL_HEADER_PATTERN = re.compile(rb'\s*(?:"|(?:Class|Trait|Extension)\s*\{)')
+
+
+def _looks_like_tonel(path: str) -> bool:
+    """Check the start of a file for a Tonel comment or definition header.
+
+    Only the first HEADER_SIZE bytes are read, so other .st files (e.g. chunk
+    format file-outs) are rejected without a full read and parse.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(HEADER_SIZE)
+    except OSError:
+        return True  # Let the linter report the read error
+    return _TONEL_HEADER_PATTERN.match(head.removeprefix(b"\xef\xbb\xbf")) is not None
+
+
+def _find_tonel_files(directory: str) -> Iterator[Path]:
+    """Recursively yield Tonel .st files under directory, excluding package.st.
+
+    Uses os.scandir so only matching entries are turned into Path objects.
+    Files that do not start like a Tonel file are skipped.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _find_tonel_files(entry.path)
+            elif (
+                entry.name.endswith(".st")
+                and entry.name != "package.st"
+                and entry.is_file()
+                and _looks_like_tonel(entry.path)
+            ):
+                yield Path(entry.path)
+
+
+def _open_cache(cache_path: str) -> LintCache | None:
+    """Open the lint cache, or warn and return None if it cannot be used."""
+    try:
+        return LintCache(cache_path)
+    except sqlite3.Error as e:
+        print(
+            f"Warning: cannot open lint cache {cache_path}: {e}; "
+            "continuing without cache",
+            file=sys.stderr,
+        )
+        return None
+
 
 def main():
     """Run the Tonel linter CLI."""
@@ -17,6 +74,38 @@ def main():
         description="Lint Tonel files for Smalltalk best practices"
     )
     parser.add_argument("target", help="Tonel file or directory to lint")
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const=DEFAULT_CACHE_FILE,
+        default=None,
+        metavar="PATH",
+        help=(
+            "Reuse lint results for unchanged files via an on-disk cache "
+            f"(default: {DEFAULT_CACHE_FILE})"
+        ),
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help=(
+            "Lint files one at a time in this process without building issue "
+            "lists (ignores --jobs and --cache)"
+        ),
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Also list files without issues",
+    )
 
     args = parser.parse_args()
     target_path = Path(args.target)
@@ -32,25 +121,36 @@ def main():
             sys.exit(1)
         files = [target_path]
     else:
-        files = list(target_path.rglob("*.st"))
-        # Exclude package.st files
-        files = [f for f in files if f.name != "package.st"]
+        files = list(_find_tonel_files(str(target_path)))
 
     if not files:
         print(f"No .st files found in {target_path}")
         sys.exit(0)
 
     # Lint all files
-    linter = TonelLinter()
+    cache = _open_cache(args.cache) if args.cache and not args.stream else None
+    linter = TonelLinter(cache=cache)
     files_analyzed = 0
 
     print(f"Linting Tonel files in {target_path}")
     print()
 
-    for file_path in sorted(files):
-        issues = linter.lint_from_file(file_path)
-        linter.print_issues(file_path, issues)
-        files_analyzed += 1
+    try:
+        if args.stream:
+            for file_path in sorted(files):
+                linter.print_issues(
+                    file_path, linter.lint_iter_from_file(file_path), args.verbose
+                )
+                files_analyzed += 1
+        else:
+            results = linter.lint_files(sorted(files), args.jobs)
+            for file_path, issues in results.items():
+                linter.print_issues(file_path, issues, args.verbose)
+                files_analyzed += 1
+    finally:
+        # Keep the results stored so far even if linting fails part way
+        if cache is not None:
+            cache.close()
 
     # Print summary and exit
     exit_code = linter.print_summary(files_analyzed)
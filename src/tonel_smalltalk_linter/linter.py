@@ -4,12 +4,135 @@ Lint Tonel files for Smalltalk best practices and code quality issues.
 Uses TonelFullParser for accurate parsing and analysis.
 """
 
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Set
+from concurrent.futures import ProcessPoolExecutor
+import functools
+import hashlib
+from itertools import accumulate, chain
+import os
 from pathlib import Path
 import re
+import string
+import sys
+import threading
+from typing import TYPE_CHECKING
 
 from tonel_smalltalk_parser.tonel_full_parser import TonelFullParser
 from tonel_smalltalk_parser.tonel_parser import MethodDefinition, TonelFile
 
+if TYPE_CHECKING:
+    from .cache import LintCache
+
+# ASCII letter classes for the class prefix check (str.isupper is Unicode-aware)
+_ASCII_UPPER = frozenset(string.ascii_uppercase)
+_ASCII_LOWER = frozenset(string.ascii_lowercase)
+
+# Method categories with a relaxed method length limit
+_SPECIAL_CATEGORY_RE = re.compile(r"building|initialization|testing|data|examples")
+
+# Method categories allowed to access instance variables directly: accessors
+# (accessing, private-accessing, accessing-properties) and initializers
+# (initialization, initializing, initialize-release, class initialization)
+_DIRECT_ACCESS_CATEGORY_RE = re.compile(r"accessing|initializ")
+
+# Maximum number of parsed files kept in memory by TonelLinter.lint
+AST_CACHE_SIZE = 128
+
+# Parsed files keyed by parser class and content digest, shared by every
+# TonelLinter in the process so duplicated files are parsed once per run.
+# Linters may run in several threads, so every access holds _AST_CACHE_LOCK.
+_AST_CACHE: OrderedDict[tuple[type, bytes], TonelFile] = OrderedDict()
+_AST_CACHE_LOCK = threading.Lock()
+
+
+def _decode_text(raw: bytes) -> str:
+    """Decode UTF-8 file content with universal newlines, like text-mode open().
+
+    CR-only (classic Squeak/Pharo fileouts) and CRLF line endings become line
+    feeds, so line-based checks see the same lines on every platform.
+    """
+    content = raw.decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def _count_body_lines(body: str) -> int:
+    """Count the lines of the stripped body without splitting it into a list.
+
+    str.strip() and str.count() are single C-level passes, which beats
+    skipping the edge whitespace by index in Python. An empty body counts as
+    one line.
+    """
+    return body.strip().count("\n") + 1
+
+
+@functools.lru_cache(maxsize=4096)
+def _access_pattern(inst_vars: frozenset[str]) -> re.Pattern[str]:
+    """Compile the direct-access alternation for a set of instance variables.
+
+    Memoized so classes sharing the same instance variables (e.g. across the
+    files of one package) reuse a single compiled pattern. A leading lookahead
+    on the possible first characters acts as a literal prefilter, letting the
+    regex engine reject most positions after a single character test. The
+    return branch is not anchored to the line start (that would defeat the
+    prefilter); callers must check that only whitespace precedes the "^".
+    """
+    alternation = "|".join(
+        re.escape(var) for var in sorted(inst_vars, key=len, reverse=True)
+    )
+    first_chars = "".join(sorted({re.escape(var[0]) for var in inst_vars}))
+    return re.compile(
+        rf"(?=[{first_chars}\^])"
+        rf"(?:\b(?P<assign>{alternation})[^\S\n]*:="
+        rf"|\^[^\S\n]*(?P<ret>{alternation})\b)"
+    )
+
+
+def _direct_accesses(
+    text: str, access_pattern: re.Pattern[str]
+) -> Iterator[tuple[int, str]]:
+    """Yield (line_start, var) for each line of text with a direct access.
+
+    At most one access is reported per line, and lines where "self" precedes
+    the variable are skipped (rough check).
+    """
+    reported_line_start = -1
+    pos = 0
+    while True:
+        match = access_pattern.search(text, pos)
+        if match is None:
+            return
+        pos = match.end()
+
+        line_start = text.rfind("\n", 0, match.start()) + 1
+        if match["ret"] and text[line_start : match.start()].strip():
+            # "^ var" not at the start of its line; resume right after "^"
+            pos = match.start() + 1
+            continue
+        if line_start == reported_line_start:
+            continue  # At most one issue per line
+
+        var = match["assign"] or match["ret"]
+        # Rough check: "self" before the variable's first use on the line
+        if text.rfind("self", line_start, text.find(var, line_start)) != -1:
+            continue
+
+        yield line_start, var
+        reported_line_start = line_start
+
+
+def _may_access(text: str, inst_vars: Set[str]) -> bool:
+    """Cheaply check whether text could contain a direct access at all."""
+    # Every match needs ":=" or "^" and a variable name; most text can be
+    # rejected by these C-level substring scans without entering the regex
+    # engine.
+    if ":=" not in text and "^" not in text:
+        return False
+    return any(var in text for var in inst_vars)
+
 
 class LintIssue:
     """Represents a linting issue.
@@ -23,6 +146,8 @@ class LintIssue:
 
     """
 
+    __slots__ = ("class_name", "is_class_method", "message", "selector", "severity")
+
     def __init__(
         self,
         severity: str,
@@ -38,11 +163,25 @@ class LintIssue:
         self.is_class_method = is_class_method
 
 
+def _lint_one(
+    linter_class: type["TonelLinter"], file_path: Path
+) -> tuple[Path, list["LintIssue"]]:
+    """Lint a single file in a worker process with a fresh, uncached linter."""
+    return file_path, linter_class()._lint_file_uncached(file_path)
+
+
 class TonelLinter:
-    """Simple linter for Tonel Smalltalk files."""
+    """Simple linter for Tonel Smalltalk files.
+
+    Args:
+        cache: Optional persistent cache used by lint_from_file to skip
+            re-linting files whose content has not changed
+
+    """
 
-    def __init__(self):
+    def __init__(self, cache: "LintCache | None" = None):
         self.parser = TonelFullParser()
+        self.cache = cache
         self.warnings = 0
         self.errors = 0
 
@@ -56,20 +195,62 @@ class TonelLinter:
             list[LintIssue]: List of linting issues found
 
         """
-        issues = []
+        return list(self.lint_iter(content))
+
+    def lint_iter(self, content: str) -> Iterator[LintIssue]:
+        """Lint Tonel content, yielding issues as they are found.
 
+        Args:
+            content: The Tonel file content as a string
+
+        Yields:
+            LintIssue: Each linting issue found
+
+        """
         try:
-            tonel_file = self.parser.parse(content)
+            tonel_file = self._parse(content)
 
             # Run lint checks
-            issues.extend(self._check_class_prefix(tonel_file))
-            issues.extend(self._check_instance_variables(tonel_file))
-            issues.extend(self._check_methods(tonel_file))
+            yield from self._check_class_prefix(tonel_file)
+            yield from self._check_instance_variables(tonel_file)
+            yield from self._check_methods(tonel_file)
 
         except Exception as e:
-            issues.append(LintIssue("error", f"Failed to parse content: {e}"))
+            yield LintIssue("error", f"Failed to parse content: {e}")
 
-        return issues
+    def _parse(self, content: str) -> TonelFile:
+        """Parse content, reusing the result for recently seen identical content.
+
+        The cache is module-level, so identical files (regenerated exports,
+        duplicated baselines) are parsed once even across linter instances.
+        Entries are keyed by the parser class too, so a linter using another
+        parser never gets a TonelFile built by a different one.
+
+        Args:
+            content: The Tonel file content as a string
+
+        Returns:
+            TonelFile: The parsed Tonel file structure
+
+        """
+        key = (
+            type(self.parser),
+            hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest(),
+        )
+        with _AST_CACHE_LOCK:
+            tonel_file = _AST_CACHE.get(key)
+            if tonel_file is not None:
+                _AST_CACHE.move_to_end(key)
+                return tonel_file
+
+        # Parse outside the lock; a concurrent parse of the same content just
+        # stores an equal result twice
+        tonel_file = self.parser.parse(content)
+        with _AST_CACHE_LOCK:
+            _AST_CACHE[key] = tonel_file
+            if len(_AST_CACHE) > AST_CACHE_SIZE:
+                _AST_CACHE.popitem(last=False)
+        return tonel_file
 
     def lint_from_file(self, file_path: Path) -> list[LintIssue]:
         """Lint a Tonel file and return list of issues.
@@ -81,12 +262,109 @@ class TonelLinter:
             list[LintIssue]: List of linting issues found
 
         """
+        if self.cache is None:
+            return self._lint_file_uncached(file_path)
+
+        try:
+            raw = Path(file_path).read_bytes()
+            content = _decode_text(raw)
+        except Exception as e:
+            return [LintIssue("error", f"Failed to read file: {e}")]
+
+        sha = self.cache.digest(raw)
+        linter_key = self.cache.linter_key(self)
+        issues = self.cache.get(file_path, sha, linter_key)
+        if issues is None:
+            issues = self.lint(content)
+            self.cache.put(file_path, sha, issues, linter_key)
+        return issues
+
+    def _lint_file_uncached(self, file_path: Path) -> list[LintIssue]:
+        """Lint a Tonel file without consulting the persistent cache."""
         try:
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
-            return self.lint(content)
+            content = _decode_text(Path(file_path).read_bytes())
         except Exception as e:
             return [LintIssue("error", f"Failed to read file: {e}")]
+        return self.lint(content)
+
+    def lint_files(
+        self, file_paths: Iterable[Path], jobs: int | None = None
+    ) -> dict[Path, list[LintIssue]]:
+        """Lint many files, in parallel worker processes where worthwhile.
+
+        Cache lookups and writes stay in the calling process; only cache
+        misses are linted. Serially they are linted by this linter; in
+        parallel each worker builds its own instance of type(self) with no
+        arguments, so subclasses must be importable and constructible that
+        way to run with jobs > 1.
+        The warning and error counters are not touched; they are updated
+        when the results are passed to print_issues.
+
+        Args:
+            file_paths: Paths of the Tonel files to lint
+            jobs: Number of worker processes (defaults to the CPU count)
+
+        Returns:
+            dict[Path, list[LintIssue]]: Issues per file, in input order
+
+        """
+        file_paths = list(file_paths)
+        results: dict[Path, list[LintIssue]] = dict.fromkeys(file_paths)
+        digests: dict[Path, bytes] = {}
+        pending = []
+        linter_key = self.cache.linter_key(self) if self.cache is not None else ""
+
+        for file_path in results:
+            if self.cache is not None:
+                try:
+                    sha = self.cache.digest(Path(file_path).read_bytes())
+                except OSError:
+                    pending.append(file_path)
+                    continue
+                issues = self.cache.get(file_path, sha, linter_key)
+                if issues is not None:
+                    results[file_path] = issues
+                    continue
+                digests[file_path] = sha
+            pending.append(file_path)
+
+        jobs = min(jobs or os.cpu_count() or 1, len(pending))
+        if jobs > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                lint_one = functools.partial(_lint_one, type(self))
+                linted = list(executor.map(lint_one, pending, chunksize=8))
+        else:
+            linted = [
+                (file_path, self._lint_file_uncached(file_path))
+                for file_path in pending
+            ]
+
+        for file_path, issues in linted:
+            results[file_path] = issues
+            if file_path in digests:
+                self.cache.put(file_path, digests[file_path], issues, linter_key)
+
+        return results
+
+    def lint_iter_from_file(self, file_path: Path) -> Iterator[LintIssue]:
+        """Lint a Tonel file, yielding issues as they are found.
+
+        Unlike lint_from_file, the persistent cache is not consulted.
+
+        Args:
+            file_path: Path to the Tonel file
+
+        Yields:
+            LintIssue: Each linting issue found
+
+        """
+        try:
+            content = _decode_text(Path(file_path).read_bytes())
+        except Exception as e:
+            yield LintIssue("error", f"Failed to read file: {e}")
+            return
+
+        yield from self.lint_iter(content)
 
     def _check_class_prefix(self, tonel_file: TonelFile) -> list[LintIssue]:
         """Check if class has appropriate prefix."""
@@ -105,9 +383,13 @@ class TonelLinter:
         # - Two or more consecutive uppercase: STClass, MCPackage
         # - Uppercase + lowercase then immediately another uppercase: ZnServer, RbNode
         # - Must have at least 3 chars and match one of these patterns
-        has_prefix = len(class_name) >= 3 and (
-            re.match(r"^[A-Z]{2,}", class_name)
-            or re.match(r"^[A-Z][a-z][A-Z]", class_name)
+        has_prefix = (
+            len(class_name) >= 3
+            and class_name[0] in _ASCII_UPPER
+            and (
+                class_name[1] in _ASCII_UPPER
+                or (class_name[1] in _ASCII_LOWER and class_name[2] in _ASCII_UPPER)
+            )
         )
 
         if not has_prefix:
@@ -141,38 +423,130 @@ class TonelLinter:
 
         return issues
 
-    def _check_methods(self, tonel_file: TonelFile) -> list[LintIssue]:
+    def _check_methods(self, tonel_file: TonelFile) -> Iterator[LintIssue]:
         """Check method lengths and direct variable access."""
-        issues = []
-
         # Get instance variables for direct access check
-        inst_vars = set()
-        for var in tonel_file.class_definition.metadata.get("instVars", []):
-            var_name = var.strip("'\"")
-            if var_name:
-                inst_vars.add(var_name)
+        # The parser yields stripped, interned names
+        inst_vars = frozenset(tonel_file.class_definition.metadata.get("instVars", ()))
+
+        # Compiled once per file and shared by every method body
+        access_pattern = self._build_access_pattern(inst_vars)
+
+        # Methods commonly share categories, so lowercase each category and
+        # resolve its length limit and direct-access exemption once per file
+        methods = tonel_file.methods
+        category_flags: dict[str, tuple[int, bool]] = {}
+        method_flags = []
+        for method in methods:
+            category = method.metadata.get("category", "") if method.metadata else ""
+            flags = category_flags.get(category)
+            if flags is None:
+                category_lower = category.lower()
+                flags = (
+                    self._method_length_limit(category_lower),
+                    self._may_access_directly(category_lower),
+                )
+                category_flags[category] = flags
+            method_flags.append(flags)
+
+        access_issues: dict[int, list[LintIssue]] = {}
+        if access_pattern is not None:
+            checked = [
+                index
+                for index, (_, may_access_directly) in enumerate(method_flags)
+                if not may_access_directly
+            ]
+            access_issues = self._check_direct_access_batch(
+                methods,
+                [method.body for method in methods],
+                checked,
+                inst_vars,
+                access_pattern,
+            )
 
-        for method in tonel_file.methods:
-            issues.extend(self._check_method_length(method))
-            issues.extend(self._check_direct_access(method, inst_vars))
+        for index, method in enumerate(methods):
+            yield from self._check_method_length(method, method_flags[index][0])
+            yield from access_issues.get(index, ())
+
+    def _check_direct_access_batch(
+        self,
+        methods: list[MethodDefinition],
+        bodies: list[str],
+        indices: list[int],
+        inst_vars: Set[str],
+        access_pattern: re.Pattern[str],
+    ) -> dict[int, list[LintIssue]]:
+        """Check several method bodies for direct access in one regex sweep.
+
+        The bodies are joined with newlines, scanned once, and each hit is
+        mapped back to its method by bisecting the body start offsets.
+
+        Args:
+            methods: Methods of the file
+            bodies: Bodies of the methods, in the same order
+            indices: Indices of the methods to check, in ascending order
+            inst_vars: Instance variable names of the class
+            access_pattern: Pattern from _build_access_pattern
+
+        Returns:
+            dict[int, list[LintIssue]]: Issues keyed by method index
+
+        """
+        issues: dict[int, list[LintIssue]] = {}
+        text = "\n".join([bodies[index] for index in indices])
+        if not _may_access(text, inst_vars):
+            return issues
+
+        starts = list(
+            accumulate((len(bodies[index]) + 1 for index in indices), initial=0)
+        )
+        for line_start, var in _direct_accesses(text, access_pattern):
+            index = indices[bisect_right(starts, line_start) - 1]
+            method = methods[index]
+            issues.setdefault(index, []).append(
+                LintIssue(
+                    "warning",
+                    f"Direct access to '{var}' (use self {var})",
+                    class_name=method.class_name,
+                    selector=method.selector,
+                    is_class_method=method.is_class_method,
+                )
+            )
 
         return issues
 
-    def _check_method_length(self, method: MethodDefinition) -> list[LintIssue]:
-        """Check if method is too long."""
+    def _category_lower(self, method: MethodDefinition) -> str:
+        """Return the lowercased method category, or "" if it has none."""
+        category = method.metadata.get("category", "") if method.metadata else ""
+        return category.lower()
+
+    def _method_length_limit(self, category_lower: str) -> int:
+        """Return the recommended maximum method length for a category."""
+        # Determine limit based on category (simplified check)
+        is_special_category = _SPECIAL_CATEGORY_RE.search(category_lower) is not None
+        return 40 if is_special_category else 15
+
+    def _check_method_length(
+        self, method: MethodDefinition, limit: int | None = None
+    ) -> list[LintIssue]:
+        """Check if method is too long.
+
+        Args:
+            method: The method to check
+            limit: Line limit for the method's category; derived from the
+                method when omitted
+
+        Returns:
+            list[LintIssue]: At most one length warning or error
+
+        """
         issues = []
 
         # Count lines in method body
-        body_lines = len(method.body.strip().split("\n"))
+        body_lines = _count_body_lines(method.body)
 
-        # Determine limit based on category (simplified check)
-        category = method.metadata.get("category", "") if method.metadata else ""
-        is_special_category = any(
-            keyword in category.lower()
-            for keyword in ["building", "initialization", "testing", "data", "examples"]
-        )
-
-        limit = 40 if is_special_category else 15
+        if limit is None:
+            limit = self._method_length_limit(self._category_lower(method))
 
         if body_lines > limit:
             if body_lines > 24 and limit == 15:
@@ -198,97 +572,89 @@ class TonelLinter:
 
         return issues
 
-    def _is_accessor_method(self, method: MethodDefinition) -> bool:
-        """Check if method is an accessor method.
+    def _may_access_directly(self, category_lower: str) -> bool:
+        """Check if method is an accessor or initializer method.
 
-        Accessor methods are allowed to directly access instance variables.
-        Patterns include: accessing, private-accessing, accessing-properties, etc.
+        Any category containing "accessing" or "initializ" qualifies.
 
         Args:
-            method: The method to check
+            category_lower: The lowercased category of the method to check
 
         Returns:
-            bool: True if method is an accessor method
+            bool: True if the method may access instance variables directly
 
         """
-        category = method.metadata.get("category", "") if method.metadata else ""
-        category_lower = category.lower()
+        return _DIRECT_ACCESS_CATEGORY_RE.search(category_lower) is not None
 
-        # Any category containing 'accessing' is considered an accessor
-        return "accessing" in category_lower
+    def _build_access_pattern(self, inst_vars: Set[str]) -> re.Pattern[str] | None:
+        """Build one regex matching direct access to any of the instance variables.
 
-    def _is_initializer_method(self, method: MethodDefinition) -> bool:
-        """Check if method is an initializer method.
-
-        Initializer methods are allowed to directly access instance variables.
-        Patterns include: initialization, initializing, initialize-release,
-        class initialization, etc.
+        Look for direct access patterns (simplified): varName := value or
+        ^ varName. A single alternation over all variables sweeps a whole
+        method body in one pass; matches never span a line break.
 
         Args:
-            method: The method to check
+            inst_vars: Instance variable names of the class
 
         Returns:
-            bool: True if method is an initializer method
+            re.Pattern | None: Compiled pattern, or None if there are no variables
 
         """
-        category = method.metadata.get("category", "") if method.metadata else ""
-        category_lower = category.lower()
-
-        # Check for various initialization patterns
-        initialization_patterns = [
-            "initializ",  # Matches: initialization, initializing, initialize-release
-            "class initialization",
-        ]
-
-        return any(pattern in category_lower for pattern in initialization_patterns)
+        if not inst_vars:
+            return None
+        return _access_pattern(frozenset(inst_vars))
 
     def _check_direct_access(
-        self, method: MethodDefinition, inst_vars: set
+        self, method: MethodDefinition, inst_vars: Set[str]
     ) -> list[LintIssue]:
-        """Check for direct instance variable access."""
-        issues = []
+        """Check a single method for direct instance variable access.
+
+        Runs the same check as _check_methods, through
+        _check_direct_access_batch.
 
+        Args:
+            method: The method to check
+            inst_vars: Instance variable names of the class
+
+        Returns:
+            list[LintIssue]: One warning per line with direct access
+
+        """
+        access_pattern = self._build_access_pattern(inst_vars)
         # Skip accessor and initialization methods
-        if self._is_accessor_method(method) or self._is_initializer_method(method):
-            return issues
+        if access_pattern is None or self._may_access_directly(
+            self._category_lower(method)
+        ):
+            return []
+        issues = self._check_direct_access_batch(
+            [method], [method.body], [0], inst_vars, access_pattern
+        )
+        return issues.get(0, [])
 
-        # Check method body for direct variable access
-        body_lines = method.body.strip().split("\n")
-
-        for line in body_lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            for var in inst_vars:
-                # Look for direct access patterns (simplified)
-                # varName := value or ^ varName
-                if (
-                    re.search(rf"\b{re.escape(var)}\s*:=", line)
-                    or re.search(rf"^\^\s*{re.escape(var)}\b", line)
-                ) and "self" not in line.split(var)[0]:  # Rough check
-                    issues.append(
-                        LintIssue(
-                            "warning",
-                            f"Direct access to '{var}' (use self {var})",
-                            class_name=method.class_name,
-                            selector=method.selector,
-                            is_class_method=method.is_class_method,
-                        )
-                    )
-                    break
+    def print_issues(
+        self, file_path: Path, issues: Iterable[LintIssue], verbose: bool = True
+    ):
+        """Print lint issues for a file.
 
-        return issues
+        Issues may be a lazy iterable (e.g. from lint_iter). Output for the
+        file is buffered and written with a single call.
+
+        Args:
+            file_path: Path of the linted file
+            issues: Issues found in the file
+            verbose: If False, print nothing for files without issues
 
-    def print_issues(self, file_path: Path, issues: list[LintIssue]):
-        """Print lint issues for a file."""
-        if not issues:
-            print(f"✓ {file_path.name}")
+        """
+        issues = iter(issues)
+        first_issue = next(issues, None)
+        if first_issue is None:
+            if verbose:
+                sys.stdout.write(f"✓ {file_path.name}\n")
             return
 
-        print(f"⚠ {file_path.name}")
+        lines = [f"⚠ {file_path.name}"]
 
-        for issue in issues:
+        for issue in chain((first_issue,), issues):
             # Build location string
             location = ""
             if issue.class_name:
@@ -301,13 +667,14 @@ class TonelLinter:
             message = f"{location}{issue.message}"
 
             if issue.severity == "error":
-                print(f"  ❌ {message}")
+                lines.append(f"  ❌ {message}")
                 self.errors += 1
             else:
-                print(f"  ⚠️  {message}")
+                lines.append(f"  ⚠️  {message}")
                 self.warnings += 1
 
-        print()
+        lines.append("\n")
+        sys.stdout.write("\n".join(lines))
 
     def print_summary(self, files_analyzed: int):
         """Print final summary."""
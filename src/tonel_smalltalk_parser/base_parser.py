@@ -1,10 +1,49 @@
 """Base parser implementation with common functionality."""
 
 from abc import ABC, abstractmethod
+import mmap
+import os
+import re
 from typing import Any, TypeAlias, TypeVar
 
 T = TypeVar("T")
 ValidationResult: TypeAlias = tuple[bool, dict[str, Any] | None]
+ParseResult: TypeAlias = tuple[bool, Any]
+
+# Line number reference in parser error messages, e.g. "... at line 3"
+_LINE_RE = re.compile(r"line (\d+)", re.IGNORECASE)
+
+# Files at least this large are decoded straight from a memory map
+MMAP_THRESHOLD = 1 << 20
+
+
+def _read_text(filepath: str) -> str:
+    """Read a UTF-8 file with universal newlines, like Path.read_text.
+
+    Large files are decoded directly from a read-only memory map, which
+    avoids holding an intermediate bytes copy of the whole file.
+
+    Args:
+        filepath: Path to the file
+
+    Returns:
+        The decoded file content
+
+    Raises:
+        OSError: If the file cannot be read
+        UnicodeDecodeError: If the file is not valid UTF-8
+
+    """
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            content = f.read().decode("utf-8")
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                content = str(mapped, "utf-8")
+
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
 
 
 class BaseParser(ABC):
@@ -40,19 +79,49 @@ class BaseParser(ABC):
               Contains 'reason' (str), 'line' (int), 'error_text' (str)
 
         """
-        try:
-            self.parse(content)
+        ok, result = self.try_parse(content)
+        if ok:
             return True, None
-        except (ValueError, SyntaxError) as e:
-            error_info = self._extract_error_info(content, e)
-            return False, error_info
+        return False, self._classify_error(content, result)
+
+    def try_parse(self, content: str) -> ParseResult:
+        """Parse content, returning failures instead of raising them.
+
+        Callers that need both the parse result and validation (e.g. batch
+        validation) can use this to parse once.
+
+        Args:
+            content: The content as a string
+
+        Returns:
+            ParseResult containing:
+            - bool: True if content was parsed successfully, False otherwise
+            - The parsed structure on success, or the raised exception
+
+        """
+        try:
+            return True, self.parse(content)
         except Exception as e:
-            error_info = {
-                "reason": f"Unexpected error: {type(e).__name__}",
-                "line": 1,
-                "error_text": str(e),
-            }
-            return False, error_info
+            return False, e
+
+    def _classify_error(self, content: str, exception: Exception) -> dict[str, Any]:
+        """Build the error information for an exception raised by parse.
+
+        Args:
+            content: The original content being parsed
+            exception: The exception that occurred during parsing
+
+        Returns:
+            Dict with 'reason' (str), 'line' (int), 'error_text' (str)
+
+        """
+        if isinstance(exception, (ValueError, SyntaxError)):
+            return self._extract_error_info(content, exception)
+        return {
+            "reason": f"Unexpected error: {type(exception).__name__}",
+            "line": 1,
+            "error_text": str(exception),
+        }
 
     def _extract_error_info(self, content: str, exception: Exception) -> dict[str, Any]:
         """Extract error information from parsing exception.
@@ -68,7 +137,6 @@ class BaseParser(ABC):
             - error_text: Text around the error location
 
         """
-        lines = content.split("\n")
         error_msg = str(exception)
 
         # Try to extract line number from exception message
@@ -77,16 +145,12 @@ class BaseParser(ABC):
             line_num = exception.lineno
         else:
             # Try to parse line number from error message
-            import re
-
-            line_match = re.search(r"line (\d+)", error_msg, re.IGNORECASE)
+            line_match = _LINE_RE.search(error_msg)
             if line_match:
                 line_num = int(line_match.group(1))
 
         # Get error text (line where error occurred)
-        error_text = ""
-        if 1 <= line_num <= len(lines):
-            error_text = lines[line_num - 1].strip()
+        error_text = self._get_line(content, line_num).strip()
 
         return {
             "reason": error_msg,
@@ -94,6 +158,29 @@ class BaseParser(ABC):
             "error_text": error_text,
         }
 
+    def _get_line(self, content: str, line_num: int) -> str:
+        """Return a single line of content without splitting all of it.
+
+        Args:
+            content: The content to search
+            line_num: 1-based line number
+
+        Returns:
+            The line without its newline, or "" if line_num is out of range
+
+        """
+        if line_num < 1:
+            return ""
+
+        start = 0
+        for _ in range(line_num - 1):
+            start = content.find("\n", start) + 1
+            if start == 0:
+                return ""
+
+        end = content.find("\n", start)
+        return content[start:] if end == -1 else content[start:end]
+
     def validate_from_file(self, filepath: str) -> ValidationResult:
         """Validate if the file can be parsed.
 
@@ -108,8 +195,7 @@ class BaseParser(ABC):
 
         """
         try:
-            with open(filepath, encoding="utf-8") as f:
-                content = f.read()
+            content = _read_text(filepath)
             return self.validate(content)
         except OSError as e:
             error_info = {
@@ -141,6 +227,5 @@ class BaseParser(ABC):
             OSError: If the file cannot be read
 
         """
-        with open(filepath, encoding="utf-8") as f:
-            content = f.read()
+        content = _read_text(filepath)
         return self.parse(content)
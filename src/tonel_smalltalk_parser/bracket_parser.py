@@ -3,8 +3,21 @@
 Implements the bracket counting + lexical analysis approach from the BNF specification.
 """
 
+from itertools import accumulate
 import re
 
+# Lexical elements that affect bracket matching, so the whole scan runs in the
+# regex engine: string literals and comments (with doubled-quote escapes, or
+# unclosed up to the end of content), character literals and brackets.
+_BRACKET_TOKEN_PATTERN = re.compile(
+    r"""'[^']*(?:''[^']*)*'?|"[^"]*(?:""[^"]*)*"?|\$.?|[\[\]]""", re.DOTALL
+)
+
+# Fast path helpers for bodies free of literals and comments
+_LITERAL_START_PATTERN = re.compile(r"""['"$]""")
+_NON_BRACKET_PATTERN = re.compile(r"[^\[\]]+")
+_BRACKET_DEPTH_DELTA = {"[": 1, "]": -1}
+
 
 class BracketParser:
     """Handles precise method body boundary detection using bracket counting.
@@ -33,104 +46,68 @@ class BracketParser:
         if start_pos >= len(content) or content[start_pos] != "[":
             raise ValueError("start_pos must point to an opening bracket '['")
 
-        pos = start_pos + 1  # Start after the opening '['
+        end_pos = self._find_plain_method_body_end(content, start_pos)
+        if end_pos is not None:
+            return end_pos
+
         bracket_count = 1
 
-        while pos < len(content) and bracket_count > 0:
-            char = content[pos]
-
-            # Handle string literals
-            if char == "'":
-                pos = self._skip_string_literal(content, pos)
-                continue
-
-            # Handle comments
-            elif char == '"':
-                pos = self._skip_comment(content, pos)
-                continue
-
-            # Handle character literals
-            elif char == "$":
-                if pos + 1 < len(content):
-                    pos += 2  # Skip $x
-                else:
-                    pos += 1
-                continue
-
-            # Handle brackets
-            elif char == "[":
+        # Only brackets are counted; literals and comments are skipped whole
+        for match in _BRACKET_TOKEN_PATTERN.finditer(content, start_pos + 1):
+            token = match.group()
+            if token == "[":
                 bracket_count += 1
-            elif char == "]":
+            elif token == "]":
                 bracket_count -= 1
+                if bracket_count == 0:
+                    return match.start()  # Position of the closing ']'
 
-            pos += 1
+        raise ValueError("Unmatched opening bracket - no closing ']' found")
 
-        if bracket_count > 0:
-            raise ValueError("Unmatched opening bracket - no closing ']' found")
+    def _find_plain_method_body_end(self, content: str, start_pos: int) -> int | None:
+        """Find the method end without a token scan when no literals are involved.
 
-        return pos - 1  # Return position of the closing ']'
-
-    def _skip_string_literal(self, content: str, start_pos: int) -> int:
-        """Skip over a string literal starting at start_pos.
-
-        Handles escaped quotes ('').
+        Tonel writes the closing `]` of a method at the start of a line, so
+        only such `]` are candidates. The text between candidates is checked
+        for strings, comments and character literals; while there are none,
+        its brackets alone decide the depth, which is tracked with C-level
+        substitution and accumulation. A candidate that closes a nested block
+        moves the search on to the next one.
 
         Args:
             content: The content string
-            start_pos: Position of the opening quote
-
-        Returns:
-            Position after the closing quote
-
-        """
-        if content[start_pos] != "'":
-            return start_pos
-
-        pos = start_pos + 1
-
-        while pos < len(content):
-            if content[pos] == "'":
-                # Check for escaped quote
-                if pos + 1 < len(content) and content[pos + 1] == "'":
-                    pos += 2  # Skip ''
-                else:
-                    return pos + 1  # Skip closing quote
-            else:
-                pos += 1
-
-        # Unclosed string literal - return end of content
-        return len(content)
-
-    def _skip_comment(self, content: str, start_pos: int) -> int:
-        """Skip over a comment starting at start_pos.
-
-        Handles escaped quotes ("").
-
-        Args:
-            content: The content string
-            start_pos: Position of the opening quote
+            start_pos: Position of the opening `[`
 
         Returns:
-            Position after the closing quote
+            Position of the matching closing `]`, or None if the fast path
+            does not apply and a full scan is needed
 
         """
-        if content[start_pos] != '"':
-            return start_pos
-
+        depth = 1
         pos = start_pos + 1
-
-        while pos < len(content):
-            if content[pos] == '"':
-                # Check for escaped quote
-                if pos + 1 < len(content) and content[pos + 1] == '"':
-                    pos += 2  # Skip ""
-                else:
-                    return pos + 1  # Skip closing quote
-            else:
-                pos += 1
-
-        # Unclosed comment - return end of content
-        return len(content)
+        while True:
+            end_pos = content.find("\n]", pos) + 1
+            if end_pos == 0:
+                return None
+            if _LITERAL_START_PATTERN.search(content, pos, end_pos):
+                return None
+
+            brackets = _NON_BRACKET_PATTERN.sub("", content[pos:end_pos])
+            if brackets:
+                # The method bracket must stay open until end_pos
+                depths = list(
+                    accumulate(
+                        map(_BRACKET_DEPTH_DELTA.__getitem__, brackets), initial=depth
+                    )
+                )
+                if min(depths) <= 0:
+                    return None
+                depth = depths[-1]
+
+            depth -= 1  # The candidate `]` itself
+            if depth == 0:
+                return end_pos
+            pos = end_pos + 1
 
     def extract_method_body(self, content: str, start_pos: int) -> tuple[str, int]:
         """Extract method body content starting from `[` at start_pos.
@@ -150,6 +127,11 @@ class BracketParser:
     def find_method_boundaries(self, content: str) -> list:
         """Find all method boundaries in the content.
 
+        The content is tokenized once; brackets inside strings, comments and
+        character literals are ignored. Top-level bracket pairs are recorded
+        as depth returns to 0. If an opening bracket is never closed, the
+        pairs nested directly inside it are reported instead.
+
         Args:
             content: The content string
 
@@ -158,21 +140,23 @@ class BracketParser:
 
         """
         boundaries = []
-        pos = 0
-
-        while pos < len(content):
-            # Find next potential method start
-            bracket_pos = content.find("[", pos)
-            if bracket_pos == -1:
-                break
-
-            try:
-                end_pos = self.find_method_body_end(content, bracket_pos)
-                boundaries.append((bracket_pos, end_pos))
-                pos = end_pos + 1
-            except ValueError:
-                # Skip this bracket and continue
-                pos = bracket_pos + 1
+        # Open bracket positions, with the pairs closed directly inside each
+        open_positions: list[int] = []
+        nested: list[list[tuple[int, int]]] = []
+
+        for match in _BRACKET_TOKEN_PATTERN.finditer(content):
+            token = match.group()
+            if token == "[":
+                open_positions.append(match.start())
+                nested.append([])
+            elif token == "]" and open_positions:
+                pair = (open_positions.pop(), match.start())
+                nested.pop()
+                (nested[-1] if nested else boundaries).append(pair)
+
+        # Unclosed brackets: fall back to the pairs they enclose, in order
+        for pairs in nested:
+            boundaries.extend(pairs)
 
         return boundaries
 
@@ -5,13 +5,43 @@ This module provides CLI commands for validating Tonel files and Smalltalk code.
 """
 
 import argparse
+from collections.abc import Mapping
+import functools
 from pathlib import Path
+import stat
 import sys
+from types import MappingProxyType
+from typing import Any
 
+from .base_parser import BaseParser, _read_text
 from .tonel_full_parser import TonelFullParser
 from .tonel_parser import TonelParser
 
 
+@functools.cache
+def _get_parser(without_method_body: bool) -> BaseParser:
+    """Return the parser shared by every validation in this process."""
+    return TonelParser() if without_method_body else TonelFullParser()
+
+
+@functools.lru_cache(maxsize=1024)
+def _validate_cached(
+    file_path: str, mtime_ns: int, size: int, without_method_body: bool
+) -> tuple[bool, Mapping[str, Any] | None]:
+    """Validate a file, memoized on its path, modification time and size.
+
+    mtime_ns and size are only part of the cache key, so an edited file is
+    validated again. Every hit returns the same result object, so the error
+    info is a read-only view. An OSError from reading the file propagates
+    and is therefore never cached.
+    """
+    content = _read_text(file_path)
+    success, error_info = _get_parser(without_method_body).validate(content)
+    if error_info is not None:
+        error_info = MappingProxyType(error_info)
+    return success, error_info
+
+
 def validate_tonel_file(file_path: str, without_method_body: bool = False) -> bool:
     """Validate a Tonel file.
 
@@ -26,21 +56,20 @@ def validate_tonel_file(file_path: str, without_method_body: bool = False) -> bo
     """
     path = Path(file_path)
 
-    if not path.exists():
+    try:
+        file_stat = path.stat()
+    except OSError:
         print(f"Error: File '{file_path}' not found", file=sys.stderr)
         return False
 
-    if not path.is_file():
+    if not stat.S_ISREG(file_stat.st_mode):
         print(f"Error: '{file_path}' is not a file", file=sys.stderr)
         return False
 
     try:
-        if without_method_body:
-            parser = TonelParser()
-            success, error_info = parser.validate_from_file(str(path))
-        else:
-            parser = TonelFullParser()
-            success, error_info = parser.validate_from_file(str(path))
+        success, error_info = _validate_cached(
+            str(path), file_stat.st_mtime_ns, file_stat.st_size, without_method_body
+        )
 
         if success:
             print(f"✓ '{file_path}' is valid")
@@ -56,6 +85,10 @@ def validate_tonel_file(file_path: str, without_method_body: bool = False) -> bo
 
         return success
 
+    except OSError:
+        # Removed or made unreadable since the stat() above
+        print(f"Error: File '{file_path}' not found", file=sys.stderr)
+        return False
     except Exception as e:
         print(f"Error validating '{file_path}': {e}", file=sys.stderr)
         return False
@@ -68,7 +101,12 @@ def main() -> int:
         description="Validate Tonel format files and Smalltalk syntax",
     )
 
-    parser.add_argument("file_path", help="Path to the Tonel file to validate")
+    parser.add_argument(
+        "file_paths",
+        nargs="+",
+        metavar="file_path",
+        help="Path(s) to the Tonel file(s) to validate",
+    )
 
     parser.add_argument(
         "--without-method-body",
@@ -80,9 +118,13 @@ def main() -> int:
 
     args = parser.parse_args()
 
-    success = validate_tonel_file(args.file_path, args.without_method_body)
+    # Validate every file, even after a failure, so all errors are reported
+    results = [
+        validate_tonel_file(file_path, args.without_method_body)
+        for file_path in args.file_paths
+    ]
 
-    return 0 if success else 1
+    return 0 if all(results) else 1
 
 
 if __name__ == "__main__":
@@ -3,62 +3,131 @@
 Based on the BNF grammar specification in doc/tonel-and-smalltalk-bnf.md.
 """
 
+from bisect import bisect_left
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum, auto
+from itertools import compress
 import re
-from typing import Any, Optional
+import sys
+from typing import Any, ClassVar, Optional
 
 from .base_parser import BaseParser
 
+# Used by SmalltalkLexer.tokenize to collect newline offsets
+_NEWLINE_PATTERN = re.compile("\n")
 
-class TokenType(Enum):
+
+class TokenType(IntEnum):
     """Token types for Smalltalk lexical analysis."""
 
     # Literals
-    STRING = "STRING"
-    SYMBOL = "SYMBOL"
-    NUMBER = "NUMBER"
-    CHARACTER = "CHARACTER"
+    STRING = auto()
+    SYMBOL = auto()
+    NUMBER = auto()
+    CHARACTER = auto()
 
     # Keywords
-    NIL = "NIL"
-    TRUE = "TRUE"
-    FALSE = "FALSE"
-    SELF = "SELF"
-    SUPER = "SUPER"
-    THISCONTEXT = "THISCONTEXT"
+    NIL = auto()
+    TRUE = auto()
+    FALSE = auto()
+    SELF = auto()
+    SUPER = auto()
+    THISCONTEXT = auto()
 
     # Identifiers and selectors
-    IDENTIFIER = "IDENTIFIER"
-    KEYWORD = "KEYWORD"  # identifier:
-    BINARY_SELECTOR = "BINARY_SELECTOR"
+    IDENTIFIER = auto()
+    KEYWORD = auto()  # identifier:
+    BINARY_SELECTOR = auto()
 
     # Delimiters
-    LPAREN = "LPAREN"  # (
-    RPAREN = "RPAREN"  # )
-    LBRACKET = "LBRACKET"  # [
-    RBRACKET = "RBRACKET"  # ]
-    LBRACE = "LBRACE"  # {
-    RBRACE = "RBRACE"  # }
-    LPARRAY = "LPARRAY"  # #(
-    LBARRAY = "LBARRAY"  # #[
+    LPAREN = auto()  # (
+    RPAREN = auto()  # )
+    LBRACKET = auto()  # [
+    RBRACKET = auto()  # ]
+    LBRACE = auto()  # {
+    RBRACE = auto()  # }
+    LPARRAY = auto()  # #(
+    LBARRAY = auto()  # #[
 
     # Operators
-    ASSIGN = "ASSIGN"  # :=
-    RETURN = "RETURN"  # ^
-    CASCADE = "CASCADE"  # ;
-    PERIOD = "PERIOD"  # .
-    PIPE = "PIPE"  # |
-    COLON = "COLON"  # :
+    ASSIGN = auto()  # :=
+    RETURN = auto()  # ^
+    CASCADE = auto()  # ;
+    PERIOD = auto()  # .
+    PIPE = auto()  # |
+    COLON = auto()  # :
 
     # Special
-    COMMENT = "COMMENT"
-    PRAGMA = "PRAGMA"
-    WHITESPACE = "WHITESPACE"
-    EOF = "EOF"
-
-
-@dataclass
+    COMMENT = auto()
+    PRAGMA = auto()
+    WHITESPACE = auto()
+    EOF = auto()
+
+
+# Token type groups shared by the lexer and parser predicates
+_RESERVED = frozenset(
+    {
+        TokenType.NIL,
+        TokenType.TRUE,
+        TokenType.FALSE,
+        TokenType.SELF,
+        TokenType.SUPER,
+        TokenType.THISCONTEXT,
+    }
+)
+_RESERVED_NAMES = frozenset({"nil", "true", "false", "self", "super", "thisContext"})
+# Tokens that may appear on the left of an assignment
+_VARIABLE_NAMES = _RESERVED | {TokenType.IDENTIFIER}
+# Tokens that can end a receiver expression of a binary message
+_PRIMARY_RECEIVERS = _VARIABLE_NAMES | {
+    TokenType.NUMBER,
+    TokenType.STRING,
+    TokenType.SYMBOL,
+    TokenType.CHARACTER,
+    TokenType.RPAREN,
+    TokenType.RBRACKET,
+}
+_TRIVIA = frozenset({TokenType.COMMENT, TokenType.PRAGMA})
+# Tokens that end a bracketed construct, or the input if it is unclosed
+_SEQUENCE_END = frozenset({TokenType.RBRACKET, TokenType.EOF})
+_TEMPORARIES_END = frozenset({TokenType.PIPE, TokenType.EOF})
+_ARRAY_END = frozenset({TokenType.RPAREN, TokenType.EOF})
+_BRACE_END = frozenset({TokenType.RBRACE, TokenType.EOF})
+# Literal array elements that stand for their own name, as in #(foo +)
+_LITERAL_ARRAY_NAMES = frozenset({TokenType.IDENTIFIER, TokenType.BINARY_SELECTOR})
+# Literal array elements whose value is fixed by the token type alone
+_LITERAL_ARRAY_CONSTANTS: dict[TokenType, Any] = {
+    TokenType.CASCADE: ";",  # Semicolon can appear in literal arrays as a symbol
+    TokenType.TRUE: True,
+    TokenType.FALSE: False,
+    TokenType.NIL: None,
+    TokenType.SELF: "self",
+    TokenType.SUPER: "super",
+    TokenType.THISCONTEXT: "thisContext",
+}
+# Single-token primaries, and the tokens that can end an expression built
+# from one of them alone
+_LEAF_PRIMARIES = _VARIABLE_NAMES | {
+    TokenType.NUMBER,
+    TokenType.STRING,
+    TokenType.SYMBOL,
+    TokenType.CHARACTER,
+}
+_LEAF_TERMINATORS = frozenset(
+    {TokenType.PERIOD, TokenType.EOF, TokenType.RBRACKET, TokenType.RBRACE}
+)
+# Names and selectors repeat heavily across methods; their values are interned
+_INTERNED = frozenset(
+    {
+        TokenType.IDENTIFIER,
+        TokenType.KEYWORD,
+        TokenType.BINARY_SELECTOR,
+        TokenType.SYMBOL,
+    }
+)
+
+
+@dataclass(slots=True)
 class Token:
     """Represents a token in Smalltalk source code."""
 
@@ -68,21 +137,21 @@ class Token:
     column: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SmalltalkExpression:
     """Base class for Smalltalk expressions."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class TemporaryVariables(SmalltalkExpression):
     """Temporary variable declarations."""
 
     variables: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class Assignment(SmalltalkExpression):
     """Assignment expression."""
 
@@ -90,14 +159,14 @@ class Assignment(SmalltalkExpression):
     value: SmalltalkExpression
 
 
-@dataclass
+@dataclass(slots=True)
 class Return(SmalltalkExpression):
     """Return statement."""
 
     expression: SmalltalkExpression
 
 
-@dataclass
+@dataclass(slots=True)
 class Block(SmalltalkExpression):
     """Block expression."""
 
@@ -105,7 +174,7 @@ class Block(SmalltalkExpression):
     body: Optional["SmalltalkSequence"]
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageSend(SmalltalkExpression):
     """Message send expression."""
 
@@ -114,7 +183,7 @@ class MessageSend(SmalltalkExpression):
     arguments: list[SmalltalkExpression]
 
 
-@dataclass
+@dataclass(slots=True)
 class Cascade(SmalltalkExpression):
     """Cascade expression (multiple messages to same receiver)."""
 
@@ -122,42 +191,42 @@ class Cascade(SmalltalkExpression):
     messages: list[tuple[str, list[SmalltalkExpression]]]  # (selector, arguments)
 
 
-@dataclass
+@dataclass(slots=True)
 class Literal(SmalltalkExpression):
     """Literal value."""
 
     value: Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Variable(SmalltalkExpression):
     """Variable reference."""
 
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LiteralArray(SmalltalkExpression):
     """Literal array."""
 
     elements: list[Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class DynamicArray(SmalltalkExpression):
     """Dynamic array."""
 
     expressions: list[SmalltalkExpression]
 
 
-@dataclass
+@dataclass(slots=True)
 class ByteArray(SmalltalkExpression):
     """Byte array literal."""
 
-    values: list[int]
+    values: bytes
 
 
-@dataclass
+@dataclass(slots=True)
 class SmalltalkSequence(SmalltalkExpression):
     """Sequence of Smalltalk statements."""
 
@@ -168,157 +237,191 @@ class SmalltalkSequence(SmalltalkExpression):
 class SmalltalkLexer:
     """Lexical analyzer for Smalltalk method bodies."""
 
-    def __init__(self):
-        # Token patterns (order matters)
-        self.token_patterns = [
-            (TokenType.COMMENT, r'"([^"]|"")*"'),
-            (
-                TokenType.PRAGMA,
-                r"<[a-zA-Z][^>]*>",
-            ),  # Pragma like <script>, <primitive: 'name' module: 'module'>
-            (TokenType.STRING, r"'([^']|'')*'"),
-            (TokenType.CHARACTER, r"\$\S"),
-            (TokenType.LPARRAY, r"#\("),
-            (TokenType.LBARRAY, r"#\["),
-            (
-                TokenType.SYMBOL,
-                r"#[a-zA-Z_][a-zA-Z0-9_]*(?:[a-zA-Z0-9_]*:)*|"
-                r"#\'([^\']|\'\')*\'|#[\\+*\/=><@%~&\-?,\|]+",
-            ),
-            (
-                TokenType.NUMBER,
-                r"-?\d+r[0-9A-Za-z]+|-?\d+\.\d+s\d*|-?\d+(\.\d+)?([eE][+-]?\d+)?",
-            ),
-            (TokenType.ASSIGN, r":="),
-            (TokenType.RETURN, r"\^"),
-            (TokenType.CASCADE, r";"),
-            (TokenType.PERIOD, r"\."),
-            (TokenType.PIPE, r"\|"),  # Keep this before binary selector
-            (TokenType.LPAREN, r"\("),
-            (TokenType.RPAREN, r"\)"),
-            (TokenType.LBRACKET, r"\["),
-            (TokenType.RBRACKET, r"\]"),
-            (TokenType.LBRACE, r"\{"),
-            (TokenType.RBRACE, r"\}"),
-            (
-                TokenType.KEYWORD,
-                r"[a-zA-Z][a-zA-Z0-9_]*:(?!=)",
-            ),  # Keyword not followed by =
-            (TokenType.IDENTIFIER, r"[a-zA-Z][a-zA-Z0-9_]*"),
-            (
-                TokenType.BINARY_SELECTOR,
-                r"[\\+*\/=><@%~&\-?,\|]+",
-            ),  # Any sequence of binary characters per BNF
-            (TokenType.COLON, r":"),
-            (TokenType.WHITESPACE, r"\s+"),
-        ]
+    # The lexer tables below are built once, when the class is created, and
+    # shared by every instance.
 
-        # Compile patterns
-        self.compiled_patterns = [
-            (
-                token_type,
-                re.compile(
-                    pattern, re.DOTALL if token_type == TokenType.COMMENT else 0
-                ),
-            )
-            for token_type, pattern in self.token_patterns
-        ]
+    # Token patterns (order matters)
+    token_patterns: ClassVar[list[tuple[TokenType, str]]] = [
+        (TokenType.COMMENT, r'"[^"]*(?:""[^"]*)*"'),
+        (
+            TokenType.PRAGMA,
+            r"<[a-zA-Z][^>]*>",
+        ),  # Pragma like <script>, <primitive: 'name' module: 'module'>
+        (TokenType.STRING, r"'[^']*(?:''[^']*)*'"),
+        (TokenType.CHARACTER, r"\$\S"),
+        (TokenType.LPARRAY, r"#\("),
+        (TokenType.LBARRAY, r"#\["),
+        (
+            TokenType.SYMBOL,
+            r"#[a-zA-Z_][a-zA-Z0-9_]*(?:[a-zA-Z0-9_]*:)*|"
+            r"#'[^']*(?:''[^']*)*'|#[\\+*\/=><@%~&\-?,\|]+",
+        ),
+        # A '-' directly before digits is lexed as the number's sign here,
+        # ahead of BINARY_SELECTOR, so no signed-number lookahead is needed
+        (
+            TokenType.NUMBER,
+            r"-?\d+r[0-9A-Za-z]+|-?\d+\.\d+s\d*|-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?",
+        ),
+        (TokenType.ASSIGN, r":="),
+        (TokenType.RETURN, r"\^"),
+        (TokenType.CASCADE, r";"),
+        (TokenType.PERIOD, r"\."),
+        (TokenType.PIPE, r"\|"),  # Keep this before binary selector
+        (TokenType.LPAREN, r"\("),
+        (TokenType.RPAREN, r"\)"),
+        (TokenType.LBRACKET, r"\["),
+        (TokenType.RBRACKET, r"\]"),
+        (TokenType.LBRACE, r"\{"),
+        (TokenType.RBRACE, r"\}"),
+        (
+            TokenType.KEYWORD,
+            r"[a-zA-Z][a-zA-Z0-9_]*:(?!=)",
+        ),  # Keyword not followed by =
+        (TokenType.IDENTIFIER, r"[a-zA-Z][a-zA-Z0-9_]*"),
+        (
+            TokenType.BINARY_SELECTOR,
+            r"[\\+*\/=><@%~&\-?,\|]+",
+        ),  # Any sequence of binary characters per BNF
+        (TokenType.COLON, r":"),
+        (TokenType.WHITESPACE, r"\s+"),
+    ]
+
+    # Combine all patterns into one alternation with a named group per
+    # token type. Alternatives are tried in order, so the first pattern
+    # that matches at a position wins, as with trying them one by one.
+    # Leading whitespace is consumed by the same match; trailing
+    # whitespace still matches the WHITESPACE group.
+    master_pattern = re.compile(
+        r"\s*(?:"
+        + "|".join(
+            f"(?P<{token_type.name}>{pattern})"
+            for token_type, pattern in token_patterns
+        )
+        + ")"
+    )
+    # Token type by group number: the matched token's group is
+    # match.lastindex, since a named group closes after any group nested in it
+    group_types: ClassVar[dict[int, TokenType]] = {
+        index: TokenType[name] for name, index in master_pattern.groupindex.items()
+    }
 
-        # Keywords
-        self.keywords = {
-            "nil": TokenType.NIL,
-            "true": TokenType.TRUE,
-            "false": TokenType.FALSE,
-            "self": TokenType.SELF,
-            "super": TokenType.SUPER,
-            "thisContext": TokenType.THISCONTEXT,
-        }
+    # Keywords
+    keywords: ClassVar[dict[str, TokenType]] = {
+        "nil": TokenType.NIL,
+        "true": TokenType.TRUE,
+        "false": TokenType.FALSE,
+        "self": TokenType.SELF,
+        "super": TokenType.SUPER,
+        "thisContext": TokenType.THISCONTEXT,
+    }
 
     def tokenize(self, text: str) -> list[Token]:
         """Tokenize Smalltalk source code."""
-        tokens = []
-        pos = 0
-        line_num = 1
-        line_start = 0
-
-        while pos < len(text):
-            # Try to match each pattern
-            matched = False
-            for token_type, pattern in self.compiled_patterns:
-                match = pattern.match(text, pos)
-                if match:
-                    value = match.group(0)
-
-                    # Calculate line and column for this token
-                    token_line = line_num
-                    token_col = pos - line_start + 1
-
-                    # Skip whitespace tokens
-                    if token_type != TokenType.WHITESPACE:
-                        # Check for keywords
-                        if (
-                            token_type == TokenType.IDENTIFIER
-                            and value in self.keywords
-                        ):
-                            token_type = self.keywords[value]
-
-                        # Check if | should be treated as binary selector
-                        if token_type == TokenType.PIPE and self._is_binary_context(
-                            tokens, value
-                        ):
-                            token_type = TokenType.BINARY_SELECTOR
-
-                        # Handle signed numbers: only - (minus) part of a number
-                        if token_type == TokenType.BINARY_SELECTOR and value == "-":
-                            # Look ahead to see if this could be a signed number
-                            remaining_text = text[match.end() :]
-                            number_pattern = r"\d+(\.\d+)?([eE][+-]?\d+)?"
-                            number_match = re.match(number_pattern, remaining_text)
-                            if number_match and self._is_signed_number_context(tokens):
-                                # Combine the sign with the number
-                                full_number = value + number_match.group(0)
-                                token_type = TokenType.NUMBER
-                                value = full_number
-                                # Update match end position
-                                new_pos = match.end() + number_match.end()
-                                pos = new_pos
-                                tokens.append(
-                                    Token(token_type, value, token_line, token_col)
-                                )
-                                matched = True
-                                break
-
-                        tokens.append(Token(token_type, value, token_line, token_col))
-
-                    # Update position and line tracking
-                    new_pos = match.end()
-                    # Count newlines in the matched text
-                    newline_count = value.count("\n")
-                    if newline_count > 0:
-                        line_num += newline_count
-                        # Find the start of the last line
-                        last_newline = value.rfind("\n")
-                        line_start = pos + last_newline + 1
-
-                    pos = new_pos
-                    matched = True
-                    break
-
-            if not matched:
-                # Handle newlines for line tracking
-                if text[pos] == "\n":
-                    line_num += 1
-                    line_start = pos + 1
-                # Skip unknown characters
-                pos += 1
-
-        # Calculate final line number for EOF token
-        final_line = line_num
-        final_col = pos - line_start
-        tokens.append(Token(TokenType.EOF, "", final_line, final_col))
-        return tokens
-
-    def _is_binary_context(self, tokens: list[Token], value: str) -> bool:
+        types, values, offsets = self.scan(text)
+        return list(map(Token, types, values, *self.positions(text, offsets)))
+
+    def scan(self, text: str) -> tuple[list[TokenType], list[str], list[int]]:
+        """Tokenize Smalltalk source code into parallel lists.
+
+        Line and column numbers are not computed here; pass the offsets to
+        positions() for the tokens that need them.
+
+        Args:
+            text: Smalltalk source code
+
+        Returns:
+            tuple: Token types, values and start offsets in text, with one
+                entry per token in source order, ending with EOF
+
+        """
+        types: list[TokenType] = []
+        values: list[str] = []
+        offsets: list[int] = []
+
+        # Block context for classifying |, maintained as tokens are emitted
+        open_blocks: list[tuple[int, int]] = []
+        pipe_positions: list[int] = []
+
+        group_types = self.group_types
+        keywords = self.keywords
+        intern = sys.intern
+        is_binary_context = self._is_binary_context
+        add_type = types.append
+        add_value = values.append
+        add_offset = offsets.append
+        whitespace = TokenType.WHITESPACE
+        identifier = TokenType.IDENTIFIER
+        pipe = TokenType.PIPE
+        lbracket = TokenType.LBRACKET
+        rbracket = TokenType.RBRACKET
+
+        # finditer scans the whole text inside the regex engine; characters
+        # no pattern accepts are skipped by its search, never tokenized
+        for match in self.master_pattern.finditer(text):
+            index = match.lastindex
+            token_type = group_types[index]
+            # Skip whitespace tokens
+            if token_type is whitespace:
+                continue
+
+            value = match.group(index)
+            if token_type in _INTERNED:
+                value = intern(value)
+                if token_type is identifier:
+                    # Check for keywords
+                    token_type = keywords.get(value, identifier)
+            elif token_type is pipe:
+                # Check if | should be treated as binary selector
+                if is_binary_context(types, open_blocks, pipe_positions):
+                    token_type = TokenType.BINARY_SELECTOR
+                else:
+                    pipe_positions.append(len(types))
+            elif token_type is lbracket:
+                open_blocks.append((len(types), len(pipe_positions)))
+            elif token_type is rbracket and open_blocks:
+                open_blocks.pop()
+
+            add_type(token_type)
+            add_value(value)
+            add_offset(match.start(index))
+
+        add_type(TokenType.EOF)
+        add_value("")
+        add_offset(len(text))
+        return types, values, offsets
+
+    def positions(self, text: str, offsets: list[int]) -> tuple[list[int], list[int]]:
+        """Convert token offsets from scan() into line and column numbers.
+
+        Args:
+            text: Smalltalk source code the offsets were scanned from
+            offsets: Token start offsets in text
+
+        Returns:
+            tuple: 1-based lines and columns, one entry per offset
+
+        """
+        # Newline offsets, after a sentinel for line 1: the line of a position
+        # is found by binary search instead of counting newlines per token
+        newlines = [-1]
+        newlines.extend(match.start() for match in _NEWLINE_PATTERN.finditer(text))
+
+        lines = [bisect_left(newlines, offset) for offset in offsets]
+        columns = [
+            offset - newlines[line - 1]
+            for offset, line in zip(offsets, lines, strict=True)
+        ]
+        # EOF sits at the end of the last line, after its last character
+        if offsets and offsets[-1] == len(text):
+            columns[-1] -= 1
+        return lines, columns
+
+    def _is_binary_context(
+        self,
+        types: list[TokenType],
+        open_blocks: list[tuple[int, int]],
+        pipe_positions: list[int],
+    ) -> bool:
         """Determine if | should be treated as a binary selector based on context.
 
         Returns True if | should be treated as binary selector, False if it's a pipe.
@@ -329,173 +432,100 @@ class SmalltalkLexer:
         3. After temp start |, next | closes temps (PIPE)
         4. All other | are binary operators (BINARY_SELECTOR)
 
-        Parentheses do NOT affect pipe meaning.
+        Parentheses do NOT affect pipe meaning. The block context is kept up
+        to date by scan, so no backward scan over tokens is needed.
+
+        Args:
+            types: Types of the tokens emitted so far
+            open_blocks: (index of the `[` token, number of pipes before it)
+                for each block still open, innermost last
+            pipe_positions: Indices of the PIPE tokens emitted so far
+
         """
-        if not tokens:
+        if not types:
             return False
 
-        # Check for block context
-        bracket_count = 0
-        for i in range(len(tokens) - 1, -1, -1):
-            token = tokens[i]
-            if token.type == TokenType.RBRACKET:
-                bracket_count += 1
-            elif token.type == TokenType.LBRACKET:
-                bracket_count -= 1
-                if bracket_count < 0:
-                    # Found the opening bracket for current block
-                    block_tokens = tokens[i + 1 :]
-
-                    # Count parameters (: followed by identifier)
-                    param_count = 0
-                    pos = 0
-                    while pos < len(block_tokens) - 1:
-                        if (
-                            block_tokens[pos].type == TokenType.COLON
-                            and block_tokens[pos + 1].type == TokenType.IDENTIFIER
-                        ):
-                            param_count += 1
-                            pos += 2
-                        else:
-                            break
-
-                    # Count pipes already seen
-                    pipe_count = sum(
-                        1 for t in block_tokens if t.type == TokenType.PIPE
-                    )
-
-                    # Rule 1: First | after parameters is terminator
-                    if param_count > 0 and pipe_count == 0:
-                        return False
-
-                    # Rule 2: Handle pipe_count==1 case
-                    # Two scenarios:
-                    # a) [ :param | | temp | ... ] - param terminator then temp
-                    # b) [ | temp | ... ] - temp variable closing
-                    # c) [ :param | expr | expr2 ] - binary operator
-                    if pipe_count == 1:
-                        if param_count == 0:
-                            # Pattern: [ | temp | - closing temp variables
-                            return False
-                        # Pattern with parameters: check if followed by another |
-                        first_pipe_idx = next(
-                            idx
-                            for idx, t in enumerate(block_tokens)
-                            if t.type == TokenType.PIPE
-                        )
-                        if first_pipe_idx + 1 < len(block_tokens):
-                            next_token = block_tokens[first_pipe_idx + 1]
-                            if next_token.type == TokenType.PIPE:
-                                # [ :param | | temp - second | starting temps
-                                return False
-                        # [ :param | expr | - binary operator
-                        return self._is_expression_receiver(block_tokens[-1])
-
-                    # Rule 3: Check for temp closing patterns
-                    # [ | temp | - pipe_count=1 (odd)
-                    # [ :param | | temp | - pipe_count=2 with params
-                    if pipe_count % 2 == 1:
-                        return False
-
-                    # Special case: [ :param | | temp |
-                    # pipe_count=2, check if 2nd pipe is immediately after 1st
-                    if param_count > 0 and pipe_count == 2:
-                        # Find first two pipes
-                        pipe_indices = [
-                            i
-                            for i, t in enumerate(block_tokens)
-                            if t.type == TokenType.PIPE
-                        ]
-                        # If 2nd pipe immediately follows 1st, this is temp closing
-                        if (
-                            len(pipe_indices) >= 2
-                            and pipe_indices[1] == pipe_indices[0] + 1
-                        ):
-                            return False
-
-                    # Even pipe count: binary operator context
-                    if len(block_tokens) > 0:
-                        return self._is_expression_receiver(block_tokens[-1])
-                    return False
-
-        # Method-level temporaries: | temp |
-        pipe_count = sum(1 for t in tokens if t.type == TokenType.PIPE)
+        if not open_blocks:
+            # Method-level temporaries: | temp |
+            if len(pipe_positions) % 2 == 1:
+                return False
+
+            # Binary operator if last token can be a receiver
+            return self._is_expression_receiver(types[-1])
+
+        # Innermost open block
+        block_start, pipes_before = open_blocks[-1]
+        if block_start == len(types) - 1:
+            return False  # | right after [
+
+        # Count parameters (: followed by identifier)
+        param_count = 0
+        pos = block_start + 1
+        while (
+            pos < len(types) - 1
+            and types[pos] is TokenType.COLON
+            and types[pos + 1] is TokenType.IDENTIFIER
+        ):
+            param_count += 1
+            pos += 2
+
+        # Count pipes already seen
+        pipe_count = len(pipe_positions) - pipes_before
+
+        # Rule 1: First | after parameters is terminator
+        if param_count > 0 and pipe_count == 0:
+            return False
+
+        # Rule 2: Handle pipe_count==1 case
+        # Three scenarios:
+        # a) [ :param | | temp | ... ] - param terminator then temp
+        # b) [ | temp | ... ] - temp variable closing
+        # c) [ :param | expr | expr2 ] - binary operator
+        if pipe_count == 1:
+            if param_count == 0:
+                # Pattern: [ | temp | - closing temp variables
+                return False
+            # In a), the last token is the first | itself, which is not a
+            # receiver; in c) it is the end of an expression
+            return self._is_expression_receiver(types[-1])
+
+        # Rule 3: Check for temp closing patterns
+        # [ | temp | - pipe_count=1 (odd)
+        # [ :param | | temp | - pipe_count=2 with params
         if pipe_count % 2 == 1:
             return False
 
-        # Binary operator if last token can be a receiver
-        return self._is_expression_receiver(tokens[-1])
+        # Special case: [ :param | | temp |
+        # pipe_count=2, check if 2nd pipe is immediately after 1st
+        if param_count > 0 and pipe_count == 2:
+            first_pipe = pipe_positions[pipes_before]
+            if pipe_positions[pipes_before + 1] == first_pipe + 1:
+                return False
 
-    def _is_expression_receiver(self, token: Token) -> bool:
+        # Even pipe count: binary operator context
+        return self._is_expression_receiver(types[-1])
+
+    def _is_expression_receiver(self, token_type: TokenType) -> bool:
         """Check if token can be a message receiver (left side of binary operator)."""
-        return token.type in [
-            TokenType.IDENTIFIER,
-            TokenType.NUMBER,
-            TokenType.STRING,
-            TokenType.SYMBOL,
-            TokenType.CHARACTER,
-            TokenType.RPAREN,
-            TokenType.RBRACKET,
-            TokenType.TRUE,
-            TokenType.FALSE,
-            TokenType.NIL,
-            TokenType.SELF,
-            TokenType.SUPER,
-            TokenType.THISCONTEXT,
-        ]
+        return token_type in _PRIMARY_RECEIVERS
 
-    def _is_signed_number_context(self, tokens: list[Token]) -> bool:
-        """Determine if - (minus) should be treated as part of a signed number.
 
-        Returns True if the - appears in a context where it should be
-        part of a number literal rather than a binary operator.
-        Note: + is never treated as part of a number in Smalltalk.
-        """
-        if not tokens:
-            return True  # Start of input - can be signed number
+def _unquote(literal: str) -> str:
+    """Strip the quotes of a quoted literal and collapse escaped quotes."""
+    text = literal[1:-1]
+    # Most literals contain no escaped quote, so skip the replace scan
+    if "''" in text:
+        return text.replace("''", "'")
+    return text
 
-        last_token = tokens[-1]
 
-        # First check if this could be a binary operator
-        # If the last token can serve as a receiver for binary messages,
-        # then - is likely a binary operator
-        if last_token.type in [
-            TokenType.IDENTIFIER,
-            TokenType.NUMBER,
-            TokenType.STRING,
-            TokenType.SYMBOL,
-            TokenType.CHARACTER,
-            TokenType.RPAREN,
-            TokenType.RBRACKET,
-            TokenType.TRUE,
-            TokenType.FALSE,
-            TokenType.NIL,
-            TokenType.SELF,
-            TokenType.SUPER,
-            TokenType.THISCONTEXT,
-        ]:
-            return False  # This is likely a binary operator
-
-        # Contexts where - should be treated as signed number:
-        # 1. After operators that expect expressions
-        # 2. After opening delimiters
-        # 3. After assignment
-        # 4. After keywords (in keyword messages)
-        return last_token.type in [
-            TokenType.ASSIGN,  # x := -5
-            TokenType.RETURN,  # ^ -5
-            TokenType.LPAREN,  # (-5)
-            TokenType.LBRACKET,  # [-5]
-            TokenType.LBRACE,  # {-5}
-            TokenType.LPARRAY,  # #(-5)
-            TokenType.LBARRAY,  # #[-5]
-            TokenType.BINARY_SELECTOR,  # x + -5 (after binary operator)
-            TokenType.KEYWORD,  # size: -5 (after keyword)
-            TokenType.CASCADE,  # obj msg; other: -5
-            TokenType.PERIOD,  # stmt. -5
-            TokenType.COLON,  # [:x | -5] (block parameter)
-            TokenType.PIPE,  # | temp | -5
-        ]
+def _symbol_value(literal: str) -> str:
+    """Return the interned name of a symbol literal such as #foo: or #'a b'."""
+    name = literal[1:]  # Remove #
+    if name.startswith("'") and name.endswith("'"):
+        name = _unquote(name)
+    # Symbols mostly name selectors, which repeat across methods
+    return sys.intern(name)
 
 
 class SmalltalkParser(BaseParser):
@@ -503,56 +533,68 @@ class SmalltalkParser(BaseParser):
 
     def __init__(self):
         self.lexer = SmalltalkLexer()
-        self.tokens = []
+        # Tokens as parallel lists: the hot type checks index a flat list, and
+        # no Token objects are built unless an error needs to report one
+        self.types = []
+        self.values = []
+        self.offsets = []
+        # Source of the current parse, to turn offsets into error positions
+        self.source = ""
+        # Comments and pragmas set aside from the token stream by parse()
+        self.trivia = []
         self.current = 0
 
     def parse(self, method_body: str) -> SmalltalkSequence:
         """Parse Smalltalk method body and return AST."""
-        self.tokens = self.lexer.tokenize(method_body)
+        scanned = self.lexer.scan(method_body)
+        # Comments and pragmas carry no meaning for the AST, so they are set
+        # aside once here instead of being skipped after every advance
+        if _TRIVIA.isdisjoint(scanned[0]):
+            self.trivia = []
+        else:
+            kept = [token_type not in _TRIVIA for token_type in scanned[0]]
+            dropped = [not keep for keep in kept]
+            types, values, offsets = (
+                list(compress(array, dropped)) for array in scanned
+            )
+            self.trivia = list(
+                map(Token, types, values, *self.lexer.positions(method_body, offsets))
+            )
+            scanned = tuple(list(compress(array, kept)) for array in scanned)
+        self.types, self.values, self.offsets = scanned
+        self.source = method_body
         self.current = 0
-        self._skip_comments()  # Skip any initial comments
         return self._parse_sequence()
 
     def _current_token(self) -> Token:
         """Get current token."""
-        if self.current < len(self.tokens):
-            return self.tokens[self.current]
-        return self.tokens[-1]  # EOF token
-
-    def _peek(self, offset: int = 1) -> Token:
-        """Peek at token ahead."""
-        pos = self.current + offset
-        if pos < len(self.tokens):
-            return self.tokens[pos]
-        return self.tokens[-1]  # EOF token
-
-    def _advance(self) -> Token:
-        """Move to next token and return current."""
-        token = self._current_token()
-        if self.current < len(self.tokens) - 1:
-            self.current += 1
-        self._skip_comments()
-        return token
-
-    def _skip_comments(self) -> None:
-        """Skip over comment and pragma tokens."""
-        while self.current < len(self.tokens) - 1 and self._current_token().type in (
-            TokenType.COMMENT,
-            TokenType.PRAGMA,
-        ):
-            self.current += 1
+        # current never moves past the trailing EOF token
+        current = self.current
+        (line,), (column,) = self.lexer.positions(self.source, [self.offsets[current]])
+        return Token(self.types[current], self.values[current], line, column)
+
+    def _advance(self) -> str:
+        """Move to next token and return the value of the current one."""
+        current = self.current
+        if current < len(self.types) - 1:
+            self.current = current + 1
+        return self.values[current]
 
     def _match(self, *token_types: TokenType) -> bool:
         """Check if current token matches any of the given types."""
-        return self._current_token().type in token_types
+        return self.types[self.current] in token_types
+
+    def _match_set(self, token_types: frozenset[TokenType]) -> bool:
+        """Check if current token type is in a precomputed set of types."""
+        return self.types[self.current] in token_types
 
-    def _consume(self, token_type: TokenType, message: str | None = None) -> Token:
-        """Consume expected token or raise error."""
-        if self._match(token_type):
+    def _consume(self, token_type: TokenType, message: str | None = None) -> str:
+        """Consume expected token and return its value, or raise error."""
+        if self.types[self.current] is token_type:
             return self._advance()
 
         current = self._current_token()
-        error_msg = message or f"Expected {token_type}, got {current.type}"
+        error_msg = message or f"Expected {token_type.name}, got {current.type.name}"
         raise SyntaxError(f"Line {current.line}, Column {current.column}: {error_msg}")
 
     def _parse_sequence(self) -> SmalltalkSequence:
@@ -573,17 +615,11 @@ class SmalltalkParser(BaseParser):
         """Parse temporary variable declarations: | var1 var2 ... |."""
         self._consume(TokenType.PIPE)
 
+        types = self.types
         variables = []
-        while not self._match(TokenType.PIPE, TokenType.EOF):
-            if self._match(TokenType.IDENTIFIER) or self._match(
-                TokenType.NIL,
-                TokenType.TRUE,
-                TokenType.FALSE,
-                TokenType.SELF,
-                TokenType.SUPER,
-                TokenType.THISCONTEXT,
-            ):
-                var_name = self._advance().value
+        while types[self.current] not in _TEMPORARIES_END:
+            if types[self.current] in _VARIABLE_NAMES:
+                var_name = self._advance()
                 self._validate_bindable_identifier(var_name)
                 variables.append(var_name)
             else:
@@ -594,26 +630,22 @@ class SmalltalkParser(BaseParser):
 
     def _parse_statements(self) -> list[SmalltalkExpression]:
         """Parse sequence of statements."""
+        types = self.types
+        period = TokenType.PERIOD
         statements = []
 
-        while not self._match(TokenType.EOF, TokenType.RBRACKET):
-            # Skip comments between statements
-            self._skip_comments()
-
-            # Check if we've reached the end after skipping comments
-            if self._match(TokenType.EOF, TokenType.RBRACKET):
-                break
-
-            # Skip standalone periods after comments (common in Smalltalk)
-            if self._match(TokenType.PERIOD):
+        while types[self.current] not in _SEQUENCE_END:
+            token_type = types[self.current]
+            # Skip standalone periods (common after comments in Smalltalk)
+            if token_type is period:
                 self._advance()
                 continue
 
             # Check for return statement
-            if self._match(TokenType.RETURN):
+            if token_type is TokenType.RETURN:
                 statements.append(self._parse_return())
                 # Handle optional period after return statement
-                if self._match(TokenType.PERIOD):
+                if types[self.current] is period:
                     self._advance()
                 break  # Return is last statement
 
@@ -623,9 +655,10 @@ class SmalltalkParser(BaseParser):
                 statements.append(expr)
 
             # Handle statement separator (period can follow comments)
-            if self._match(TokenType.PERIOD):
+            token_type = types[self.current]
+            if token_type is period:
                 self._advance()
-            elif not self._match(TokenType.EOF, TokenType.RBRACKET):
+            elif token_type not in _SEQUENCE_END:
                 # Allow end without period
                 break
 
@@ -644,15 +677,23 @@ class SmalltalkParser(BaseParser):
 
         Also handles binarySend | unarySend | primary.
         """
-        if not self._current_token() or self._match(TokenType.EOF):
+        types = self.types
+        if types[self.current] is TokenType.EOF:
             return None
 
-        # Skip comments at expression level (they should not be statements)
-        if self._match(TokenType.COMMENT, TokenType.PRAGMA):
-            return None
+        # A lone variable or literal is the most common expression; build it
+        # directly instead of descending through every precedence level
+        if (
+            types[self.current + 1] in _LEAF_TERMINATORS
+            and types[self.current] in _LEAF_PRIMARIES
+        ):
+            return self._parse_primary()
 
-        # Try assignment
-        if self._is_assignment():
+        # Try assignment; the current token is not EOF, so the next one exists
+        if (
+            types[self.current + 1] is TokenType.ASSIGN
+            and types[self.current] in _VARIABLE_NAMES
+        ):
             return self._parse_assignment()
 
         # Parse message send expression
@@ -661,31 +702,19 @@ class SmalltalkParser(BaseParser):
 
     def _is_assignment(self) -> bool:
         """Check if current position is an assignment."""
-        # Check for identifier or reserved word followed by :=
+        # Check for identifier or reserved word followed by :=; a variable
+        # name is never the trailing EOF, so the second read is in range
+        types = self.types
+        current = self.current
         return (
-            self._match(TokenType.IDENTIFIER)
-            or self._match(
-                TokenType.NIL,
-                TokenType.TRUE,
-                TokenType.FALSE,
-                TokenType.SELF,
-                TokenType.SUPER,
-                TokenType.THISCONTEXT,
-            )
-        ) and self._peek().type == TokenType.ASSIGN
+            types[current] in _VARIABLE_NAMES and types[current + 1] is TokenType.ASSIGN
+        )
 
     def _parse_assignment(self) -> Assignment:
         """Parse assignment: variable := expression."""
         # Get variable name from either identifier or reserved word
-        if self._match(TokenType.IDENTIFIER) or self._match(
-            TokenType.NIL,
-            TokenType.TRUE,
-            TokenType.FALSE,
-            TokenType.SELF,
-            TokenType.SUPER,
-            TokenType.THISCONTEXT,
-        ):
-            variable = self._advance().value
+        if self._match_set(_VARIABLE_NAMES):
+            variable = self._advance()
         else:
             raise SyntaxError("Expected variable name in assignment")
 
@@ -716,23 +745,15 @@ class SmalltalkParser(BaseParser):
                 # Parse message at the appropriate precedence level
                 if self._match(TokenType.KEYWORD):
                     # Keyword message
-                    selector_parts = []
-                    arguments = []
-                    while self._match(TokenType.KEYWORD):
-                        keyword = self._advance().value
-                        selector_parts.append(keyword)
-                        arg = self._parse_binary_send()
-                        arguments.append(arg)
-                    selector = "".join(selector_parts)
-                    messages.append((selector, arguments))
+                    messages.append(self._parse_message())
                 elif self._match(TokenType.BINARY_SELECTOR):
                     # Binary message
-                    selector = self._advance().value
+                    selector = self._advance()
                     arg = self._parse_unary_send()
                     messages.append((selector, [arg]))
                 elif self._match(TokenType.IDENTIFIER):
                     # Unary message
-                    selector = self._advance().value
+                    selector = self._advance()
                     messages.append((selector, []))
                 else:
                     raise SyntaxError("Expected message selector after ';'")
@@ -743,32 +764,44 @@ class SmalltalkParser(BaseParser):
 
     def _parse_keyword_send(self) -> SmalltalkExpression:
         """Parse keyword message send."""
+        types = self.types
         receiver = self._parse_binary_send()
 
         # Check for keyword message
-        if self._match(TokenType.KEYWORD):
-            selector_parts = []
-            arguments = []
-
-            while self._match(TokenType.KEYWORD):
-                keyword = self._advance().value
+        if types[self.current] is TokenType.KEYWORD:
+            keyword = self._advance()
+            arg = self._parse_binary_send()
+            if arg is None:
+                raise SyntaxError(f"Expected argument after keyword {keyword}")
+            # Most keyword sends have a single keyword, whose interned token
+            # value already is the selector
+            if types[self.current] is not TokenType.KEYWORD:
+                return MessageSend(receiver, keyword, [arg])
+
+            selector_parts = [keyword]
+            arguments = [arg]
+            while types[self.current] is TokenType.KEYWORD:
+                keyword = self._advance()
                 selector_parts.append(keyword)
                 arg = self._parse_binary_send()
                 if arg is None:
                     raise SyntaxError(f"Expected argument after keyword {keyword}")
                 arguments.append(arg)
 
-            selector = "".join(selector_parts)
+            # Joined selectors such as at:put: repeat across methods as much
+            # as their keywords do
+            selector = sys.intern("".join(selector_parts))
             return MessageSend(receiver, selector, arguments)
 
         return receiver
 
     def _parse_binary_send(self) -> SmalltalkExpression:
         """Parse binary message send."""
+        types = self.types
         left = self._parse_unary_send()
 
-        while self._match(TokenType.BINARY_SELECTOR):
-            operator = self._advance().value
+        while types[self.current] is TokenType.BINARY_SELECTOR:
+            operator = self._advance()
             right = self._parse_unary_send()
             left = MessageSend(left, operator, [right])
 
@@ -776,12 +809,13 @@ class SmalltalkParser(BaseParser):
 
     def _parse_unary_send(self) -> SmalltalkExpression:
         """Parse unary message send."""
+        types = self.types
         receiver = self._parse_primary()
 
-        while self._match(TokenType.IDENTIFIER):
+        while types[self.current] is TokenType.IDENTIFIER:
             # Check if this is really a unary message (not followed by :)
-            if self._peek().type != TokenType.COLON:
-                selector = self._advance().value
+            if types[self.current + 1] is not TokenType.COLON:
+                selector = self._advance()
                 receiver = MessageSend(receiver, selector, [])
             else:
                 break
@@ -793,51 +827,39 @@ class SmalltalkParser(BaseParser):
 
         Also handles parenthesized expression.
         """
-        if self._match(TokenType.IDENTIFIER):
-            return Variable(self._advance().value)
-
-        elif self._match(
-            TokenType.NIL,
-            TokenType.TRUE,
-            TokenType.FALSE,
-            TokenType.SELF,
-            TokenType.SUPER,
-            TokenType.THISCONTEXT,
-        ):
-            token = self._advance()
-            if token.type == TokenType.NIL:
+        token_type = self.types[self.current]
+        if token_type is TokenType.IDENTIFIER:
+            return Variable(self._advance())
+
+        elif token_type in _RESERVED:
+            value = self._advance()
+            if token_type is TokenType.NIL:
                 return Literal(None)
-            elif token.type == TokenType.TRUE:
+            elif token_type is TokenType.TRUE:
                 return Literal(True)
-            elif token.type == TokenType.FALSE:
+            elif token_type is TokenType.FALSE:
                 return Literal(False)
             else:  # SELF, SUPER, THISCONTEXT
-                return Variable(token.value)
+                return Variable(value)
 
-        elif self._match(TokenType.NUMBER):
-            value = self._advance().value
+        elif token_type is TokenType.NUMBER:
+            value = self._advance()
             return Literal(self._parse_number_literal(value))
 
-        elif self._match(TokenType.STRING):
-            value = self._advance().value[1:-1]  # Remove quotes
-            # Handle escaped quotes
-            value = value.replace("''", "'")
-            return Literal(value)
+        elif token_type is TokenType.STRING:
+            return Literal(_unquote(self._advance()))
 
-        elif self._match(TokenType.CHARACTER):
-            value = self._advance().value[1]  # Remove $
+        elif token_type is TokenType.CHARACTER:
+            value = self._advance()[1]  # Remove $
             return Literal(value)
 
-        elif self._match(TokenType.SYMBOL):
-            value = self._advance().value[1:]  # Remove #
-            if value.startswith("'") and value.endswith("'"):
-                value = value[1:-1].replace("''", "'")
-            return Literal(value)
+        elif token_type is TokenType.SYMBOL:
+            return Literal(_symbol_value(self._advance()))
 
-        elif self._match(TokenType.LBRACKET):
+        elif token_type is TokenType.LBRACKET:
             return self._parse_block()
 
-        elif self._match(TokenType.LPAREN):
+        elif token_type is TokenType.LPAREN:
             self._advance()  # consume (
             # Allow full expression parsing including assignment and cascade
             if self._is_assignment():
@@ -849,13 +871,13 @@ class SmalltalkParser(BaseParser):
                 raise SyntaxError("Expected expression inside parentheses")
             return expr
 
-        elif self._match(TokenType.LBRACE):
+        elif token_type is TokenType.LBRACE:
             return self._parse_dynamic_array()
 
-        elif self._match(TokenType.LPARRAY):
+        elif token_type is TokenType.LPARRAY:
             return self._parse_literal_array()
 
-        elif self._match(TokenType.LBARRAY):
+        elif token_type is TokenType.LBARRAY:
             return self._parse_byte_array()
 
         else:
@@ -863,18 +885,20 @@ class SmalltalkParser(BaseParser):
             token = self._current_token()
             raise SyntaxError(
                 f"Line {token.line}, Column {token.column}: "
-                f"Unexpected token {token.type}"
+                f"Unexpected token {token.type.name}"
             )
 
     def _parse_block(self) -> Block:
         """Parse block: [ parameters? | temporaries? body ]."""
         self._consume(TokenType.LBRACKET)
 
+        types = self.types
+        colon = TokenType.COLON
         parameters = []
         # Parse block parameters if present
-        while self._match(TokenType.COLON):
+        while types[self.current] is colon:
             self._advance()  # consume :
-            param = self._consume(TokenType.IDENTIFIER).value
+            param = self._consume(TokenType.IDENTIFIER)
             parameters.append(param)
 
         # If we have parameters, expect | separator
@@ -883,7 +907,7 @@ class SmalltalkParser(BaseParser):
 
         # Parse block body (which may include temporaries)
         body = None
-        if not self._match(TokenType.RBRACKET, TokenType.EOF):
+        if not self._match_set(_SEQUENCE_END):
             # Parse temporaries and statements separately for blocks
             temporaries = None
             statements = []
@@ -907,15 +931,22 @@ class SmalltalkParser(BaseParser):
         """Parse dynamic array: { expressions }."""
         self._consume(TokenType.LBRACE)
 
+        types = self.types
+        if types[self.current] is TokenType.RBRACE:
+            self._advance()
+            return DynamicArray([])
+
+        period, rbrace = TokenType.PERIOD, TokenType.RBRACE
         expressions = []
-        while not self._match(TokenType.RBRACE, TokenType.EOF):
+        while types[self.current] not in _BRACE_END:
             expr = self._parse_expression()
             if expr:
                 expressions.append(expr)
 
-            if self._match(TokenType.PERIOD):
+            token_type = types[self.current]
+            if token_type is period:
                 self._advance()
-            elif not self._match(TokenType.RBRACE):
+            elif token_type is not rbrace:
                 break
 
         self._consume(TokenType.RBRACE)
@@ -928,69 +959,62 @@ class SmalltalkParser(BaseParser):
             tuple: (success, element) where success is True if an element was parsed
 
         """
-        if self._match(TokenType.NUMBER):
-            value = self._advance().value
+        # Branches are ordered by how often each element kind shows up in
+        # real literal arrays: symbols and bare names dominate, constants
+        # such as true or nil are rare
+        token_type = self.types[self.current]
+        if token_type is TokenType.SYMBOL:
+            return (True, _symbol_value(self._advance()))
+        elif token_type in _LITERAL_ARRAY_NAMES:
+            return (True, self._advance())
+        elif token_type is TokenType.NUMBER:
+            value = self._advance()
             return (True, self._parse_number_literal(value))
-        elif self._match(TokenType.STRING):
-            value = self._advance().value[1:-1].replace("''", "'")
+        elif token_type is TokenType.STRING:
+            return (True, _unquote(self._advance()))
+        elif token_type is TokenType.CHARACTER:
+            value = self._advance()[1]
             return (True, value)
-        elif self._match(TokenType.CHARACTER):
-            value = self._advance().value[1]
-            return (True, value)
-        elif self._match(TokenType.SYMBOL):
-            value = self._advance().value[1:]
-            if value.startswith("'") and value.endswith("'"):
-                value = value[1:-1].replace("''", "'")
-            return (True, value)
-        elif self._match(TokenType.IDENTIFIER) or self._match(
-            TokenType.BINARY_SELECTOR
-        ):
-            return (True, self._advance().value)
-        elif self._match(TokenType.CASCADE):
-            # Semicolon can appear in literal arrays as a symbol
-            self._advance()
-            return (True, ";")
-        elif self._match(TokenType.TRUE):
-            self._advance()
-            return (True, True)
-        elif self._match(TokenType.FALSE):
-            self._advance()
-            return (True, False)
-        elif self._match(TokenType.NIL):
+        elif token_type in _LITERAL_ARRAY_CONSTANTS:
             self._advance()
-            return (True, None)
-        elif self._match(TokenType.SELF):
-            self._advance()
-            return (True, "self")
-        elif self._match(TokenType.SUPER):
-            self._advance()
-            return (True, "super")
-        elif self._match(TokenType.THISCONTEXT):
-            self._advance()
-            return (True, "thisContext")
+            return (True, _LITERAL_ARRAY_CONSTANTS[token_type])
         else:
             return (False, None)
 
     def _parse_literal_array(self) -> LiteralArray:
-        """Parse literal array: #( elements )."""
+        """Parse literal array: #( elements ).
+
+        Nested literal arrays are tracked on an explicit stack of the
+        enclosing element lists rather than by recursion, so nesting depth
+        is not bounded by the interpreter's recursion limit.
+        """
         self._consume(TokenType.LPARRAY)
 
-        elements = []
-        while not self._match(TokenType.RPAREN, TokenType.EOF):
-            if self._match(TokenType.LPARRAY):
+        types = self.types
+        if types[self.current] is TokenType.RPAREN:
+            self._advance()
+            return LiteralArray([])
+
+        lparray, lparen = TokenType.LPARRAY, TokenType.LPAREN
+        elements: list[Any] = []
+        parents: list[list[Any]] = []
+        while True:
+            token_type = types[self.current]
+            if token_type is lparray:
                 # Nested literal array #(...)
-                nested = self._parse_literal_array()
-                elements.append(nested.elements)
-            elif self._match(TokenType.LPAREN):
+                self._advance()
+                parents.append(elements)
+                elements = []
+            elif token_type is lparen:
                 # Regular parenthesis in literal array is treated as nested array
                 # e.g., #(a b(c d)) becomes #(#a #b #(#c #d))
                 self._advance()  # consume '('
                 nested_elements = []
-                while not self._match(TokenType.RPAREN, TokenType.EOF):
+                while types[self.current] not in _ARRAY_END:
                     success, element = self._parse_literal_array_element()
                     if success:
                         nested_elements.append(element)
-                    elif self._match(TokenType.LPAREN):
+                    elif types[self.current] is lparen:
                         # Recursively handle nested parentheses - not yet supported
                         token = self._current_token()
                         raise SyntaxError(
@@ -1005,54 +1029,68 @@ class SmalltalkParser(BaseParser):
                 success, element = self._parse_literal_array_element()
                 if success:
                     elements.append(element)
-                else:
-                    break
-
-        self._consume(TokenType.RPAREN)
-        return LiteralArray(elements)
+                    continue
+                # Anything else must be the ')' closing the innermost array
+                self._consume(TokenType.RPAREN)
+                if not parents:
+                    return LiteralArray(elements)
+                parent = parents.pop()
+                parent.append(elements)
+                elements = parent
 
     def _parse_byte_array(self) -> ByteArray:
         """Parse byte array: #[ integers ]."""
         self._consume(TokenType.LBARRAY)
 
-        values = []
-        while not self._match(TokenType.RBRACKET, TokenType.EOF):
-            if self._match(TokenType.NUMBER):
-                value_str = self._advance().value
+        types = self.types
+        if types[self.current] is TokenType.RBRACKET:
+            self._advance()
+            return ByteArray(b"")
+
+        number = TokenType.NUMBER
+        values = bytearray()
+        # Only numbers can be elements; anything else ends the array
+        while types[self.current] is number:
+            value_str = self._advance()
+            if value_str.isascii() and value_str.isdigit():
+                value = int(value_str)
+            else:
+                # Signed literals still convert; radix and float forms do not
                 try:
                     value = int(value_str)
-                    if 0 <= value <= 255:
-                        values.append(value)
-                    else:
-                        raise SyntaxError(f"Byte value must be 0-255, got {value}")
                 except ValueError as e:
                     raise SyntaxError(f"Invalid byte value: {value_str}") from e
-            else:
-                break
+            if value & ~0xFF:
+                raise SyntaxError(f"Byte value must be 0-255, got {value}")
+            values.append(value)
 
         self._consume(TokenType.RBRACKET)
-        return ByteArray(values)
+        return ByteArray(bytes(values))
 
     def _parse_message(self) -> tuple[str, list[SmalltalkExpression]]:
         """Parse message (selector + arguments) for cascade."""
         if self._match(TokenType.IDENTIFIER):
-            selector = self._advance().value
+            selector = self._advance()
             return selector, []
         elif self._match(TokenType.BINARY_SELECTOR):
-            selector = self._advance().value
+            selector = self._advance()
             arg = self._parse_unary_send()
             return selector, [arg]
         elif self._match(TokenType.KEYWORD):
-            selector_parts = []
-            arguments = []
+            keyword = self._advance()
+            arg = self._parse_binary_send()
+            if not self._match(TokenType.KEYWORD):
+                return keyword, [arg]
 
+            selector_parts = [keyword]
+            arguments = [arg]
             while self._match(TokenType.KEYWORD):
-                keyword = self._advance().value
+                keyword = self._advance()
                 selector_parts.append(keyword)
                 arg = self._parse_binary_send()
                 arguments.append(arg)
 
-            selector = "".join(selector_parts)
+            selector = sys.intern("".join(selector_parts))
             return selector, arguments
         else:
             raise SyntaxError("Expected message selector")
@@ -1066,35 +1104,38 @@ class SmalltalkParser(BaseParser):
         - Radix integers: 16rFF, 2r1010, -16r100
         - Scaled decimals: 3.14s2
         """
+        # Plain unsigned integers are by far the most common literal, and a
+        # run of ASCII digits always converts
+        if value.isascii() and value.isdigit():
+            return int(value)
+
         # Radix integer: 16rFF, 2r1010, -16r100
-        if "r" in value:
-            parts = value.split("r")
-            if len(parts) == 2:
-                base_part = parts[0]
-                digits = parts[1]
-                # Handle negative sign
-                is_negative = base_part.startswith("-")
-                base = int(base_part[1:]) if is_negative else int(base_part)
-                try:
-                    result = int(digits, base)
-                    return -result if is_negative else result
-                except ValueError as e:
-                    raise SyntaxError(f"Invalid radix number: {value}") from e
+        base_part, radix, digits = value.partition("r")
+        if radix:
+            # Only the first 'r' separates the base; digits of bases above 27
+            # may contain 'r' themselves (36rZr)
+            # The sign is lexed onto the base: -16r100 is -(16r100)
+            base = int(base_part)
+            is_negative = base < 0
+            if is_negative:
+                base = -base
+            try:
+                result = int(digits, base)
+                return -result if is_negative else result
+            except ValueError as e:
+                raise SyntaxError(f"Invalid radix number: {value}") from e
 
         # Scaled decimal: 3.14s2
-        if "s" in value:
-            parts = value.split("s")
-            if len(parts) == 2:
-                number_part = parts[0]
-                # scale_part = parts[1] if parts[1] else "0"  # Future enhancement
-                try:
-                    # For now, treat as float - could be enhanced for precise decimal
-                    return float(number_part)
-                except ValueError as e:
-                    raise SyntaxError(f"Invalid scaled decimal: {value}") from e
+        number_part, scale, _ = value.partition("s")
+        if scale:
+            # The scale is not kept yet; could be enhanced for precise decimal
+            try:
+                return float(number_part)
+            except ValueError as e:
+                raise SyntaxError(f"Invalid scaled decimal: {value}") from e
 
         # Regular float with exponential notation or decimal point
-        if "." in value or "e" in value.lower():
+        if "." in value or "e" in value or "E" in value:
             try:
                 return float(value)
             except ValueError as e:
@@ -1108,11 +1149,12 @@ class SmalltalkParser(BaseParser):
 
     def _is_reserved_identifier(self, name: str) -> bool:
         """Check if identifier is reserved and cannot be used as variable name."""
-        return name in ["nil", "true", "false", "self", "super", "thisContext"]
+        return name in _RESERVED_NAMES
 
     def _validate_bindable_identifier(self, name: str) -> None:
         """Validate that identifier can be used as variable name."""
-        if self._is_reserved_identifier(name):
+        # Same set as _is_reserved_identifier, probed without the extra call
+        if name in _RESERVED_NAMES:
             raise SyntaxError(
                 f"Cannot use reserved identifier '{name}' as variable name"
             )
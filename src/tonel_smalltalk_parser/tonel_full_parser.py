@@ -4,6 +4,8 @@ Combined parser that handles both Tonel format parsing and Smalltalk method
 body validation.
 """
 
+import functools
+
 from .base_parser import BaseParser
 from .smalltalk_parser import SmalltalkParser
 from .tonel_parser import TonelFile, TonelParser
@@ -21,6 +23,18 @@ class TonelFullParser(BaseParser):
         self.tonel_parser = TonelParser()
         self.smalltalk_parser = SmalltalkParser()
 
+        parse_method_body = self.smalltalk_parser.parse
+
+        def validate_method_body(body: str) -> None:
+            parse_method_body(body)
+
+        # Identical bodies such as trivial accessors recur across methods and
+        # files, so each distinct valid body is parsed once. Failures raise
+        # and are not cached.
+        self._validate_method_body = functools.lru_cache(maxsize=4096)(
+            validate_method_body
+        )
+
     def parse(self, content: str) -> TonelFile:
         """Parse Tonel content and return structured representation.
 
@@ -41,7 +55,7 @@ class TonelFullParser(BaseParser):
         # Validate each method body with Smalltalk parser
         for method in tonel_file.methods:
             try:
-                self.smalltalk_parser.parse(method.body)
+                self._validate_method_body(method.body)
             except (SyntaxError, Exception) as e:
                 raise SyntaxError(
                     f"Invalid Smalltalk syntax in method "
@@ -5,6 +5,7 @@ Manual parser that handles Tonel format parsing with precise bracket matching.
 
 from dataclasses import dataclass
 import re
+import sys
 from typing import Any
 
 from .base_parser import BaseParser
@@ -208,7 +209,8 @@ class TonelParser(BaseParser):
 
                 value_str = ston_str[value_start:value_end].strip()
 
-                # Parse array content
+                # Parse array content; items (e.g. instVars names) are stripped
+                # and interned, so consumers can use them as keys directly
                 array_content = value_str[1:-1].strip()
                 if array_content:
                     # Split by comma, respecting strings
@@ -222,14 +224,14 @@ class TonelParser(BaseParser):
                         elif ch == "," and not in_string:
                             item = current_item.strip().strip("'\"")
                             if item:
-                                items.append(item)
+                                items.append(sys.intern(item))
                             current_item = ""
                         else:
                             current_item += ch
                     # Don't forget the last item
                     item = current_item.strip().strip("'\"")
                     if item:
-                        items.append(item)
+                        items.append(sys.intern(item))
                     result[key] = items
                 else:
                     result[key] = []
@@ -25,6 +25,8 @@ class TestANSISmalltalkFeatures:
             ("2r1010", 10),
             ("8r777", 511),
             ("10r123", 123),
+            ("36rZr", 1287),
+            ("-16r100", -256),
         ]
 
         for code, expected in test_cases:
@@ -33,6 +35,9 @@ class TestANSISmalltalkFeatures:
             assert isinstance(result.statements[0], Literal)
             assert result.statements[0].value == expected
 
+        with pytest.raises(SyntaxError, match="Invalid radix number: 2r101bar"):
+            parser.parse("2r101bar")
+
     def test_scaled_decimals(self):
         """Test scaled decimal parsing."""
         parser = SmalltalkParser()
@@ -74,10 +79,10 @@ class TestANSISmalltalkFeatures:
 
         # Test valid byte arrays
         test_cases = [
-            ("#[1 2 3]", [1, 2, 3]),
-            ("#[0 255]", [0, 255]),
-            ("#[]", []),
-            ("#[42]", [42]),
+            ("#[1 2 3]", b"\x01\x02\x03"),
+            ("#[0 255]", b"\x00\xff"),
+            ("#[]", b""),
+            ("#[42]", b"*"),
         ]
 
         for code, expected in test_cases:
@@ -97,6 +102,9 @@ class TestANSISmalltalkFeatures:
         with pytest.raises(SyntaxError, match="Byte value must be 0-255"):
             parser.parse("#[-1]")
 
+        with pytest.raises(SyntaxError, match=r"Invalid byte value: 1\.5"):
+            parser.parse("#[1.5]")
+
     def test_reserved_identifier_validation(self):
         """Test reserved identifier validation."""
         parser = SmalltalkParser()
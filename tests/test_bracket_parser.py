@@ -0,0 +1,66 @@
+"""Tests for the BracketParser method body boundary detection."""
+
+import pytest
+
+from tonel_smalltalk_parser.bracket_parser import BracketParser
+
+
+class TestBracketParser:
+    """Test bracket matching around literals, comments and nesting."""
+
+    def setup_method(self):
+        """Set up for each test method."""
+        self.parser = BracketParser()
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            "\n    ^ value\n",
+            " ^ [ [ 1 + 2 ] value ] value ",
+            " ^ 'string with ] and '' quote' ",
+            ' "comment with ] and "" quote" ^ self ',
+            " ^ $] ",
+            " ^ $' , $\" ",
+        ],
+    )
+    def test_extract_method_body(self, body):
+        """Test extracting bodies that contain tricky characters."""
+        content = f"Counter >> value [{body}]\n\nCounter >> other [ ]"
+        extracted, end_pos = self.parser.extract_method_body(content, content.find("["))
+        assert extracted == body
+        assert end_pos == len(body) + content.find("[") + 1
+
+    def test_unmatched_bracket(self):
+        """Test that a missing closing bracket raises ValueError."""
+        content = "X >> y [ ^ [ 1 ] 'unclosed ]"
+        with pytest.raises(ValueError, match="Unmatched opening bracket"):
+            self.parser.find_method_body_end(content, content.find("["))
+
+    def test_find_method_boundaries(self):
+        """Test finding consecutive top-level bracket pairs."""
+        content = "[ a ] [ 'b]' ] ["
+        assert self.parser.find_method_boundaries(content) == [(0, 4), (6, 13)]
+
+    def test_find_method_boundaries_skips_top_level_comments(self):
+        """Test that brackets in comments outside methods are not method starts."""
+        content = '"see [ here" X >> y [ ^ 1 ]'
+        assert self.parser.find_method_boundaries(content) == [(20, 26)]
+
+    def test_find_method_boundaries_inside_unclosed_bracket(self):
+        """Test that pairs nested in an unclosed bracket are still reported."""
+        content = "[ [ a ] [ [ b ] "
+        assert self.parser.find_method_boundaries(content) == [(2, 6), (10, 14)]
+
+    def test_plain_body_fast_path(self):
+        """Test literal-free bodies, including a nested block closed at column 0."""
+        content = "X >> y [\n  ^ [ :a |\n  a ]\n]\n\nX >> z [\n  ^ [ 1\n] value\n]"
+        first = content.find("[")
+        assert (
+            self.parser.find_method_body_end(content, first) == content.find("\n]") + 1
+        )
+
+        second = content.find("[", content.find("X >> z"))
+        assert self.parser.find_method_body_end(content, second) == len(content) - 1
+        assert (
+            self.parser._find_plain_method_body_end(content, second) == len(content) - 1
+        )
@@ -7,7 +7,8 @@ from unittest.mock import patch
 
 import pytest
 
-from tonel_smalltalk_parser.cli import main, validate_tonel_file
+from tonel_smalltalk_parser.cli import _validate_cached, main, validate_tonel_file
+from tonel_smalltalk_parser.tonel_full_parser import TonelFullParser
 
 
 class TestValidateTonelFile:
@@ -108,6 +109,66 @@ Counter >> value [
 
             Path(f.name).unlink()
 
+    def test_validate_reuses_result_for_unchanged_file(self):
+        """Test that an unchanged file is parsed once and an edited one again."""
+        content = """Class {
+    #name : #Counter,
+    #superclass : #Object
+}"""
+        with tempfile.TemporaryDirectory() as tmp:
+            file_path = Path(tmp) / "Counter.st"
+            file_path.write_text(content, encoding="utf-8")
+
+            with patch.object(
+                TonelFullParser,
+                "validate",
+                autospec=True,
+                side_effect=lambda self, content: (True, None),
+            ) as validate:
+                assert validate_tonel_file(str(file_path)) is True
+                assert validate_tonel_file(str(file_path)) is True
+                assert validate.call_count == 1
+
+                file_path.write_text(content + "\n", encoding="utf-8")
+                assert validate_tonel_file(str(file_path)) is True
+                assert validate.call_count == 2
+
+    def test_cached_error_info_is_read_only(self, capsys):
+        """Test that a cache hit cannot be changed through an earlier result."""
+        with tempfile.TemporaryDirectory() as tmp:
+            file_path = Path(tmp) / "Broken.st"
+            file_path.write_text("Invalid Tonel content", encoding="utf-8")
+            file_stat = file_path.stat()
+
+            _, error_info = _validate_cached(
+                str(file_path), file_stat.st_mtime_ns, file_stat.st_size, False
+            )
+            with pytest.raises(TypeError):
+                error_info["reason"] = "tampered"
+
+            assert validate_tonel_file(str(file_path)) is False
+
+        assert "tampered" not in capsys.readouterr().err
+
+    def test_file_removed_after_stat_is_not_found(self, capsys):
+        """Test that a read failure is reported as not found and not cached."""
+        content = """Class {
+    #name : #Counter,
+    #superclass : #Object
+}"""
+        with tempfile.TemporaryDirectory() as tmp:
+            file_path = Path(tmp) / "Counter.st"
+            file_path.write_text(content, encoding="utf-8")
+
+            with patch(
+                "tonel_smalltalk_parser.cli._read_text",
+                side_effect=FileNotFoundError(2, "No such file"),
+            ):
+                assert validate_tonel_file(str(file_path)) is False
+            assert "Error: File" in capsys.readouterr().err
+
+            assert validate_tonel_file(str(file_path)) is True
+
 
 class TestCLIMain:
     """Test the CLI main function."""
@@ -194,6 +255,29 @@ Counter >> value [
 
             Path(f.name).unlink()
 
+    def test_cli_with_multiple_files(self):
+        """Test CLI validates every file and fails if any file is invalid."""
+        with tempfile.TemporaryDirectory() as tmp:
+            valid = Path(tmp) / "Counter.st"
+            valid.write_text(
+                "Class {\n    #name : #Counter,\n    #superclass : #Object\n}",
+                encoding="utf-8",
+            )
+            invalid = Path(tmp) / "Invalid.st"
+            invalid.write_text("Invalid Tonel content", encoding="utf-8")
+
+            with patch("sys.argv", ["validate-tonel", str(valid), str(valid)]):
+                assert main() == 0
+
+            stdout_capture = io.StringIO()
+            with (
+                patch("sys.argv", ["validate-tonel", str(invalid), str(valid)]),
+                patch("sys.stdout", stdout_capture),
+                patch("sys.stderr", io.StringIO()),
+            ):
+                assert main() == 1
+                assert f"✓ '{valid}' is valid" in stdout_capture.getvalue()
+
     def test_cli_with_nonexistent_file(self):
         """Test CLI with non-existent file and stderr output."""
         stderr_capture = io.StringIO()
@@ -122,6 +122,48 @@ class TestSmalltalkLexer:
         actual_values = [t.value for t in binary_tokens]
         assert actual_values == expected_values
 
+    def test_lexers_share_compiled_patterns(self):
+        """Test that constructing a lexer does not recompile its patterns."""
+        assert SmalltalkLexer().master_pattern is SmalltalkLexer().master_pattern
+
+    def test_token_positions(self):
+        """Test line and column numbers across multi-line tokens."""
+        lexer = SmalltalkLexer()
+        tokens = lexer.tokenize("\"multi\nline\" x\n  ^ 'a\nb' y\n")
+
+        positions = [(t.type, t.line, t.column) for t in tokens]
+        assert positions == [
+            (TokenType.COMMENT, 1, 1),
+            (TokenType.IDENTIFIER, 2, 7),
+            (TokenType.RETURN, 3, 3),
+            (TokenType.STRING, 3, 5),
+            (TokenType.IDENTIFIER, 4, 4),
+            (TokenType.EOF, 5, 0),
+        ]
+
+    def test_scan_matches_tokenize(self):
+        """Test that scan and positions give tokenize's fields as lists."""
+        lexer = SmalltalkLexer()
+        source = "| a | a := #(1 $b) , 'c'.\n\"note\" ^ a"
+
+        types, values, offsets = lexer.scan(source)
+        lines, columns = lexer.positions(source, offsets)
+        tokens = lexer.tokenize(source)
+
+        assert types == [t.type for t in tokens]
+        assert values == [t.value for t in tokens]
+        assert lines == [t.line for t in tokens]
+        assert columns == [t.column for t in tokens]
+
+    def test_selector_values_are_interned(self):
+        """Test that repeated names and selectors share one string object."""
+        lexer = SmalltalkLexer()
+        first = lexer.tokenize("aCollection do: #each")
+        second = lexer.tokenize("".join(["aCollection", " do:", " #each"]))
+
+        for left, right in zip(first[:-1], second[:-1], strict=True):
+            assert left.value is right.value
+
 
 class TestSmalltalkParser:
     """Test cases for the Smalltalk parser."""
@@ -331,6 +373,22 @@ class TestSmalltalkParser:
             ["void", "*", "hFile", ",", "uint", 0],
         ]
 
+    def test_deeply_nested_literal_array(self):
+        """Test that literal array nesting is not bounded by recursion depth."""
+        depth = 5000
+        ast = SmalltalkParser().parse("#(" * depth + "1" + ")" * depth)
+
+        elements = ast.statements[0].elements
+        for _ in range(depth - 1):
+            assert len(elements) == 1
+            elements = elements[0]
+        assert elements == [1]
+
+    def test_unclosed_nested_literal_array(self):
+        """Test that a missing inner ')' is reported at the end of input."""
+        with pytest.raises(SyntaxError, match="Expected RPAREN, got EOF"):
+            SmalltalkParser().parse("#(1 #(2 3)")
+
     def test_dynamic_array(self):
         """Test parsing dynamic array."""
         parser = SmalltalkParser()
@@ -341,6 +399,17 @@ class TestSmalltalkParser:
         assert isinstance(stmt, DynamicArray)
         assert len(stmt.expressions) == 2
 
+    def test_empty_collection_literals(self):
+        """Test that empty collection literals each get their own node."""
+        ast = SmalltalkParser().parse("{}. {}. #(). #(). #[]")
+
+        first, second, third, fourth, fifth = ast.statements
+        assert first == second == DynamicArray([])
+        assert first is not second
+        assert third == fourth == LiteralArray([])
+        assert third.elements is not fourth.elements
+        assert fifth.values == b""
+
     def test_complex_method(self):
         """Test parsing complex method with multiple elements."""
         parser = SmalltalkParser()
@@ -391,6 +460,57 @@ class TestSmalltalkParser:
         assert isinstance(inner_stmt, MessageSend)
         assert isinstance(inner_stmt.receiver, Block)
 
+    def test_ast_nodes_have_no_instance_dict(self):
+        """Test that AST nodes are slotted and carry no per-instance __dict__."""
+        result = SmalltalkParser().parse("^ x foo: 1")
+
+        statement = result.statements[0]
+        for node in (result, statement, statement.expression):
+            assert not hasattr(node, "__dict__")
+
+    def test_comments_are_set_aside(self):
+        """Test comments anywhere in a statement are kept out of the AST."""
+        parser = SmalltalkParser()
+        result = parser.parse('<primitive: 1> x "target" := "value" 3')
+
+        assert result.statements == [Assignment("x", Literal(3))]
+        assert [token.type for token in parser.trivia] == [
+            TokenType.PRAGMA,
+            TokenType.COMMENT,
+            TokenType.COMMENT,
+        ]
+
+    def test_quoted_literal_values(self):
+        """Test that string and quoted symbol literals unescape doubled quotes."""
+        result = SmalltalkParser().parse(
+            "{'plain'. 'it''s'. #'a''b'. #'c d'}. #('x''y' #'z''')"
+        )
+
+        dynamic, literal = result.statements
+        assert [element.value for element in dynamic.expressions] == [
+            "plain",
+            "it's",
+            "a'b",
+            "c d",
+        ]
+        assert literal.elements == ["x'y", "z'"]
+
+    def test_symbol_literal_values_are_interned(self):
+        """Test that equal symbol literals share one string object."""
+        first = SmalltalkParser().parse("^ #at:put:").statements[0]
+        second = SmalltalkParser().parse("#(#'at:put:')").statements[0]
+
+        assert first.expression.value == "at:put:"
+        assert first.expression.value is second.elements[0]
+
+    def test_keyword_selectors_are_interned(self):
+        """Test that equal multi-keyword selectors share one string object."""
+        first = SmalltalkParser().parse("x at: 1 put: 2").statements[0]
+        second = SmalltalkParser().parse("y at: 3 put: 4").statements[0]
+
+        assert first.selector == "at:put:"
+        assert first.selector is second.selector
+
     def test_character_literals(self):
         """Test parsing character literals."""
         parser = SmalltalkParser()
@@ -481,6 +601,18 @@ class TestIntegration:
         with pytest.raises(SyntaxError):
             parse_smalltalk_method_body("x := ")  # Incomplete assignment
 
+    def test_error_message_names_token_types(self):
+        """Test syntax errors name token types rather than their integer codes."""
+        with pytest.raises(SyntaxError, match="Expected RPAREN, got EOF"):
+            parse_smalltalk_method_body("^ (1 + 2")
+
+    def test_error_position(self):
+        """Test syntax errors report the line and column of the bad token."""
+        with pytest.raises(SyntaxError, match="Line 2, Column 6: Expected RPAREN"):
+            parse_smalltalk_method_body('"note"\n^ (1 ]')
+        with pytest.raises(SyntaxError, match="Line 2, Column 3: Expected RPAREN"):
+            parse_smalltalk_method_body("x.\n(1 ")
+
     def test_empty_method(self):
         """Test parsing empty method body."""
         ast = parse_smalltalk_method_body("")
@@ -955,6 +1087,17 @@ class TestLexerBitwiseOrContext:
         # Third pipe: nested block parameter separator
         assert pipe_tokens[2].type == TokenType.PIPE
 
+    def test_pipe_after_nested_block_is_binary(self):
+        """Test that | after a closed nested block uses the enclosing block."""
+        tokens = self.lexer.tokenize("[ :a | [ :b | b ] value | a ]")
+
+        pipe_types = [t.type for t in tokens if t.value == "|"]
+        assert pipe_types == [
+            TokenType.PIPE,
+            TokenType.PIPE,
+            TokenType.BINARY_SELECTOR,
+        ]
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
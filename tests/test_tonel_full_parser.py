@@ -58,6 +58,32 @@ TestClass >> badMethod [
         assert "Invalid Smalltalk syntax" in str(exc_info.value)
         assert "TestClass>>badMethod" in str(exc_info.value)
 
+    def test_identical_method_bodies_are_parsed_once(self):
+        """Test that a repeated valid body is validated from the cache."""
+        content = """Class {
+    #name : #Point3D,
+    #superclass : #Object
+}
+
+Point3D >> x [
+    ^ value
+]
+
+Point3D >> y [
+    ^ value
+]
+
+Point3D >> bad [
+    x :=
+]"""
+        for _ in range(2):
+            with pytest.raises(SyntaxError, match="Point3D>>bad"):
+                self.parser.parse(content)
+
+        info = self.parser._validate_method_body.cache_info()
+        assert info.currsize == 1
+        assert info.hits == 3
+
 
 class TestTonelFullParserValidation:
     """Test cases for TonelFullParser validation methods."""
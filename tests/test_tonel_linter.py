@@ -1,9 +1,14 @@
 """Tests for Tonel Smalltalk Linter."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import pickle
 import tempfile
 
-from tonel_smalltalk_linter import LintIssue, TonelLinter
+import pytest
+
+from tonel_smalltalk_linter import LintCache, LintIssue, TonelLinter
+from tonel_smalltalk_linter.linter import _AST_CACHE
 
 
 class TestLintIssue:
@@ -82,6 +87,36 @@ STTestClass >> var1: aValue [
             finally:
                 Path(f.name).unlink()
 
+    def test_lint_from_file_normalizes_line_endings(self):
+        """Test that CR-only and CRLF files are linted like LF files."""
+        content = """Class {
+    #name : #STCounter,
+    #superclass : #Object,
+    #instVars : [ 'count' ]
+}
+
+{ #category : #actions }
+STCounter >> reset [
+    count := 0.
+    ^ count
+]
+"""
+        linter = TonelLinter()
+        with tempfile.TemporaryDirectory() as tmp:
+            results = []
+            for newline in ["\n", "\r", "\r\n"]:
+                file_path = Path(tmp) / "STCounter.st"
+                file_path.write_bytes(content.replace("\n", newline).encode("utf-8"))
+                results.append(
+                    (
+                        [i.message for i in linter.lint_from_file(file_path)],
+                        [i.message for i in linter.lint_iter_from_file(file_path)],
+                    )
+                )
+
+        expected = ["Direct access to 'count' (use self count)"] * 2
+        assert results == [(expected, expected)] * 3
+
     def test_lint_with_valid_content(self):
         """Test linting valid Tonel content."""
         content = """Class {
@@ -105,6 +140,114 @@ STTestClass >> var1 [
         # Should have no issues for a well-formed class
         assert len(issues) == 0
 
+    def test_lint_reuses_parse_of_identical_content(self):
+        """Test that re-linting unchanged content skips parsing."""
+        content = """Class {
+    #name : #STTestClass,
+    #superclass : #Object
+}
+"""
+        _AST_CACHE.clear()
+        linter = TonelLinter()
+        calls = []
+        original_parse = linter.parser.parse
+        linter.parser.parse = lambda text: calls.append(text) or original_parse(text)
+
+        linter.lint(content)
+        linter.lint(content)
+        linter.lint(content.replace("#Object", "#STBase"))
+
+        assert len(calls) == 2
+
+    def test_parse_cache_is_shared_across_linters(self):
+        """Test that identical content is parsed once across linter instances."""
+        content = """Class {
+    #name : #STSharedClass,
+    #superclass : #Object
+}
+"""
+        _AST_CACHE.clear()
+        TonelLinter().lint(content)
+
+        linter = TonelLinter()
+        calls = []
+        original_parse = linter.parser.parse
+        linter.parser.parse = lambda text: calls.append(text) or original_parse(text)
+        linter.lint(content)
+
+        assert calls == []
+
+    def test_parse_cache_is_keyed_by_parser_class(self):
+        """Test that a linter with another parser class does not reuse its ASTs."""
+        from tonel_smalltalk_parser.tonel_full_parser import TonelFullParser
+
+        class CountingParser(TonelFullParser):
+            def __init__(self):
+                super().__init__()
+                self.calls = 0
+
+            def parse(self, content):
+                self.calls += 1
+                return super().parse(content)
+
+        content = """Class {
+    #name : #STKeyedClass,
+    #superclass : #Object
+}
+"""
+        _AST_CACHE.clear()
+        TonelLinter().lint(content)
+
+        linter = TonelLinter()
+        linter.parser = CountingParser()
+        linter.lint(content)
+        linter.lint(content)
+
+        assert linter.parser.calls == 1
+
+    def test_parse_cache_is_safe_across_threads(self, monkeypatch):
+        """Test that concurrent linters never report cache races as errors."""
+        monkeypatch.setattr("tonel_smalltalk_linter.linter.AST_CACHE_SIZE", 2)
+        _AST_CACHE.clear()
+        contents = [
+            f"Class {{\n    #name : #STClass{n},\n    #superclass : #Object\n}}\n"
+            for n in range(6)
+        ]
+
+        def lint_repeatedly():
+            linter = TonelLinter()
+            return [
+                issue.message
+                for _ in range(50)
+                for content in contents
+                for issue in linter.lint(content)
+            ]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: lint_repeatedly(), range(4)))
+
+        assert results == [[]] * 4
+
+    def test_lint_iter_matches_lint(self):
+        """Test that the streaming API yields the same issues as lint."""
+        content = """Class {
+    #name : #Object2,
+    #superclass : #Object,
+    #instVars : [ 'count' ]
+}
+
+Object2 >> reset [
+    count := 0
+]
+"""
+        linter = TonelLinter()
+        streamed = linter.lint_iter(content)
+
+        assert not isinstance(streamed, list)
+        assert [issue.message for issue in streamed] == [
+            issue.message for issue in linter.lint(content)
+        ]
+
     def test_check_class_prefix(self):
         """Test class prefix checking."""
         # Create a mock TonelFile
@@ -232,6 +375,25 @@ STTestClass >> var1 [
         assert issues[0].selector == "longMethod"
         assert issues[0].is_class_method is False
 
+    def test_check_method_length_ignores_surrounding_blank_lines(self):
+        """Test that blank lines around the body do not count toward length."""
+        from tonel_smalltalk_parser.tonel_parser import MethodDefinition
+
+        body = "\r\n\n" + "\r\n".join(["    x := 1."] * 15) + "\r\n\n\t"
+        method = MethodDefinition(
+            class_name="TestClass",
+            is_class_method=False,
+            selector="exactlyAtLimit",
+            body=body,
+            metadata={"category": "#someCategory"},
+        )
+
+        linter = TonelLinter()
+        assert linter._check_method_length(method) == []
+        assert linter._check_method_length(method, limit=14)[0].message == (
+            "Method long: 15 lines (recommended: 14)"
+        )
+
     def test_check_method_length_error(self):
         """Test method length checking with error threshold."""
         from tonel_smalltalk_parser.tonel_parser import MethodDefinition
@@ -283,6 +445,56 @@ STTestClass >> var1 [
         assert all(issue.selector == "badMethod" for issue in issues)
         assert all(issue.is_class_method is False for issue in issues)
 
+    def test_direct_access_issues_follow_their_methods(self):
+        """Test that file-wide access checks report under the right methods."""
+        content = """Class {
+    #name : #STCounter,
+    #superclass : #Object,
+    #instVars : [ 'count' ]
+}
+
+{ #category : #actions }
+STCounter >> reset [
+    count := 0
+]
+
+{ #category : #accessing }
+STCounter >> count [
+    ^ count
+]
+
+{ #category : #actions }
+STCounter >> empty [
+]
+
+{ #category : #actions }
+STCounter >> current [
+    ^ count
+]
+"""
+        issues = TonelLinter().lint(content)
+
+        assert [issue.selector for issue in issues] == ["reset", "current"]
+        assert all("Direct access to 'count'" in i.message for i in issues)
+
+    def test_check_direct_access_multiple_vars(self):
+        """Test one issue per offending line across several instance variables."""
+        from tonel_smalltalk_parser.tonel_parser import MethodDefinition
+
+        method = MethodDefinition(
+            class_name="TestClass",
+            is_class_method=False,
+            selector="badMethod",
+            body="    count := total := 0.\n    self total: 1.\n    ^ count",
+            metadata={"category": "#someCategory"},
+        )
+
+        linter = TonelLinter()
+        issues = linter._check_direct_access(method, {"count", "total", "unused"})
+
+        assert len(issues) == 2
+        assert "'count'" in issues[1].message
+
     def test_check_direct_access_in_accessor(self):
         """Test that direct access is allowed in accessor methods."""
         from tonel_smalltalk_parser.tonel_parser import MethodDefinition
@@ -409,6 +621,43 @@ STTestClass >> var1 [
         # Should have no issues for class initialization methods
         assert len(issues) == 0
 
+    @pytest.mark.parametrize(
+        ("category", "expected"),
+        [
+            ("Accessing", True),
+            ("private-accessing", True),
+            ("accessing-properties", True),
+            ("private - Initialization", True),
+            ("initializing", True),
+            ("initialize-release", True),
+            ("class initialization", True),
+            ("access", False),
+            ("initial values", False),
+            ("actions", False),
+            ("", False),
+        ],
+    )
+    def test_may_access_directly(self, category, expected):
+        """Test the combined accessor/initializer category check."""
+        linter = TonelLinter()
+        assert linter._may_access_directly(category.lower()) is expected
+
+    def test_print_issues_verbose(self, capsys):
+        """Test that clean files are only listed in verbose mode."""
+        linter = TonelLinter()
+
+        linter.print_issues(Path("STClean.st"), [], verbose=False)
+        assert capsys.readouterr().out == ""
+
+        linter.print_issues(Path("STClean.st"), [])
+        assert capsys.readouterr().out == "✓ STClean.st\n"
+
+        linter.print_issues(
+            Path("Foo.st"), iter([LintIssue("error", "Broken", class_name="Foo")])
+        )
+        assert capsys.readouterr().out == "⚠ Foo.st\n  ❌ [Foo] Broken\n\n"
+        assert linter.errors == 1
+
     def test_print_summary(self):
         """Test summary printing."""
         linter = TonelLinter()
@@ -437,3 +686,225 @@ STTestClass >> var1 [
 
         exit_code = linter.print_summary(5)
         assert exit_code == 0  # no issues
+
+    def test_lint_files_uses_subclass_checks(self):
+        """Test that serial lint_files runs the checks of a linter subclass."""
+
+        class NoPrefixLinter(TonelLinter):
+            def _check_class_prefix(self, tonel_file):
+                return []
+
+        with tempfile.TemporaryDirectory() as tmp:
+            file_path = Path(tmp) / "Beta.st"
+            file_path.write_text(
+                "Class {\n    #name : #Beta,\n    #superclass : #Object\n}\n",
+                encoding="utf-8",
+            )
+
+            assert len(TonelLinter().lint_files([file_path], jobs=1)[file_path]) == 1
+            assert NoPrefixLinter().lint_files([file_path], jobs=1)[file_path] == []
+
+
+class TestLintCache:
+    """Test LintCache persistence."""
+
+    CONTENT = """Class {
+    #name : #Object2,
+    #superclass : #Object,
+    #category : #Test
+}
+"""
+
+    def test_lint_from_file_uses_cache(self):
+        """Test that unchanged files are served from the cache."""
+        with tempfile.TemporaryDirectory() as tmp:
+            file_path = Path(tmp) / "Object2.st"
+            file_path.write_text(self.CONTENT, encoding="utf-8")
+            cache_path = Path(tmp) / "cache.sqlite"
+
+            cache = LintCache(cache_path)
+            issues = TonelLinter(cache=cache).lint_from_file(file_path)
+            cache.close()
+            assert len(issues) == 1
+
+            cache = LintCache(cache_path)
+            linter = TonelLinter(cache=cache)
+            linter.lint = None  # Any call to lint would fail on a cache hit
+            cached = linter.lint_from_file(file_path)
+            cache.close()
+            assert [i.message for i in cached] == [i.message for i in issues]
+
+    def test_issues_round_trip_as_plain_values(self):
+        """Test that every issue field survives a store and reload."""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = Path(tmp) / "cache.sqlite"
+            cache = LintCache(cache_path)
+            cache.put(
+                "A.st",
+                b"sha",
+                [
+                    LintIssue("warning", "Method long", "STA", "foo:", True),
+                    LintIssue("error", "Failed to parse content"),
+                ],
+                "linter",
+            )
+            cache.close()
+
+            cache = LintCache(cache_path)
+            issues = cache.get("A.st", b"sha", "linter")
+            cache.close()
+
+        assert [
+            (i.severity, i.message, i.class_name, i.selector, i.is_class_method)
+            for i in issues
+        ] == [
+            ("warning", "Method long", "STA", "foo:", True),
+            ("error", "Failed to parse content", None, None, None),
+        ]
+
+    def test_pickled_entries_are_not_loaded(self):
+        """Test that a pickle payload in the cache file is treated as a miss."""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = LintCache(Path(tmp) / "cache.sqlite")
+            cache.connection.execute(
+                "INSERT INTO ast (path, linter, sha, issues) VALUES (?, ?, ?, ?)",
+                ("A.st", "linter", b"sha", pickle.dumps([LintIssue("error", "x")])),
+            )
+
+            assert cache.get("A.st", b"sha", "linter") is None
+            cache.close()
+
+    def test_lint_from_file_invalidates_changed_content(self):
+        """Test that a content change causes the file to be re-linted."""
+        with tempfile.TemporaryDirectory() as tmp:
+            file_path = Path(tmp) / "Object2.st"
+            file_path.write_text(self.CONTENT, encoding="utf-8")
+            cache = LintCache(Path(tmp) / "cache.sqlite")
+            linter = TonelLinter(cache=cache)
+
+            assert len(linter.lint_from_file(file_path)) == 1
+            file_path.write_text(
+                self.CONTENT.replace("#Object2", "#STObject"), encoding="utf-8"
+            )
+            assert linter.lint_from_file(file_path) == []
+            cache.close()
+
+    def test_write_failures_warn_and_disable_writes(self, capsys):
+        """Test that a failing cache write warns once instead of raising."""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = LintCache(Path(tmp) / "cache.sqlite")
+            cache.connection.close()  # Every statement now fails
+
+            cache.put("A.st", b"sha", [], "linter")
+            cache.put("B.st", b"sha", [], "linter")
+            assert cache.get("A.st", b"sha", "linter") is None
+            cache.close()
+
+        assert not cache.writable
+        assert capsys.readouterr().err.count("Warning: cannot write lint cache") == 1
+
+    def test_linter_classes_do_not_share_entries(self):
+        """Test that a linter subclass never gets the base linter's results."""
+
+        class NoPrefixLinter(TonelLinter):
+            def _check_class_prefix(self, tonel_file):
+                return []
+
+        with tempfile.TemporaryDirectory() as tmp:
+            file_path = Path(tmp) / "Object2.st"
+            file_path.write_text(self.CONTENT, encoding="utf-8")
+            cache = LintCache(Path(tmp) / "cache.sqlite")
+
+            base = TonelLinter(cache=cache).lint_from_file(file_path)
+            subclass = NoPrefixLinter(cache=cache).lint_from_file(file_path)
+            batch = NoPrefixLinter(cache=cache).lint_files([file_path], jobs=1)
+            base_again = TonelLinter(cache=cache).lint_from_file(file_path)
+            cache.close()
+
+        assert len(base) == 1
+        assert subclass == []
+        assert batch[file_path] == []
+        assert len(base_again) == 1
+
+    def test_lint_files_serves_hits_from_cache(self):
+        """Test that batch linting stores misses and reuses them later."""
+        with tempfile.TemporaryDirectory() as tmp:
+            file_path = Path(tmp) / "Object2.st"
+            file_path.write_text(self.CONTENT, encoding="utf-8")
+            cache = LintCache(Path(tmp) / "cache.sqlite")
+
+            first = TonelLinter(cache=cache).lint_files([file_path], jobs=1)
+            sha = cache.digest(file_path.read_bytes())
+            cached = cache.get(file_path, sha, cache.linter_key(TonelLinter()))
+            second = TonelLinter(cache=cache).lint_files([file_path], jobs=1)
+            cache.close()
+
+            assert list(first) == [file_path]
+            assert [i.message for i in cached] == [i.message for i in first[file_path]]
+            assert [i.message for i in second[file_path]] == [
+                i.message for i in first[file_path]
+            ]
+
+
+class TestLintCLI:
+    """Test the lint-tonel command line entry point."""
+
+    def test_lint_files_parallel_preserves_order(self):
+        """Test that parallel linting returns results in input order."""
+        with tempfile.TemporaryDirectory() as tmp:
+            files = []
+            for name in ["STAlpha", "Beta", "STGamma"]:
+                file_path = Path(tmp) / f"{name}.st"
+                file_path.write_text(
+                    f"Class {{\n    #name : #{name},\n    #superclass : #Object\n}}\n",
+                    encoding="utf-8",
+                )
+                files.append(file_path)
+
+            results = TonelLinter().lint_files(files, jobs=2)
+
+            assert list(results) == files
+            assert [len(issues) for issues in results.values()] == [0, 1, 0]
+
+    def test_unusable_cache_path_lints_without_cache(self, monkeypatch, capsys):
+        """Test that a cache that cannot be opened only produces a warning."""
+        from tonel_smalltalk_linter.cli import main
+
+        with tempfile.TemporaryDirectory() as tmp:
+            file_path = Path(tmp) / "STAlpha.st"
+            file_path.write_text(
+                "Class {\n    #name : #STAlpha,\n    #superclass : #Object\n}\n",
+                encoding="utf-8",
+            )
+            cache_path = Path(tmp) / "missing" / "cache.sqlite"
+            monkeypatch.setattr(
+                "sys.argv", ["lint-tonel", "--cache", str(cache_path), str(file_path)]
+            )
+
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 0
+        captured = capsys.readouterr()
+        assert "Warning: cannot open lint cache" in captured.err
+        assert "Files analyzed: 1" in captured.out
+
+    def test_find_tonel_files_skips_package_st(self):
+        """Test recursive discovery of Tonel .st files excluding package.st."""
+        from tonel_smalltalk_linter.cli import _find_tonel_files
+
+        with tempfile.TemporaryDirectory() as tmp:
+            nested = Path(tmp) / "Pkg"
+            nested.mkdir()
+            for file_path, content in [
+                (Path(tmp) / "STTop.st", "Class {\n    #name : #STTop\n}\n"),
+                (nested / "STNested.st", '"A comment"\nTrait { #name : #STNested }'),
+                (nested / "package.st", "Package { #name : #Pkg }\n"),
+                (nested / "README.md", "Class { }\n"),
+                (nested / "FileOut.st", "Object subclass: #Foo!\n"),
+            ]:
+                file_path.write_text(content, encoding="utf-8")
+
+            found = sorted(path.name for path in _find_tonel_files(tmp))
+
+            assert found == ["STNested.st", "STTop.st"]
@@ -1,6 +1,7 @@
 """Test cases for Tonel parser functionality."""
 
 import os
+import sys
 import tempfile
 
 import pytest
@@ -222,6 +223,10 @@ Counter >> complexMethod [
         metadata = result.class_definition.metadata
         assert metadata is not None
         # Note: Full STON parsing might need refinement
+        assert metadata["instVars"] == ["value", "count"]
+        assert all(
+            name is sys.intern(name.encode().decode()) for name in metadata["instVars"]
+        )
 
     def test_method_without_metadata(self):
         """Test parsing method without metadata."""
@@ -378,6 +383,30 @@ Class {
 }"""
         assert self.parser.validate(extension_content)[0] is True
 
+    def test_try_parse(self):
+        """Test try_parse returns the result or the exception without raising."""
+        ok, tonel_file = self.parser.try_parse(
+            "Class {\n    #name : #Counter,\n    #superclass : #Object\n}"
+        )
+        assert ok is True
+        assert tonel_file.class_definition.metadata["name"] == "Counter"
+
+        ok, error = self.parser.try_parse("Not Tonel")
+        assert ok is False
+        assert isinstance(error, ValueError)
+
+    def test_validate_unexpected_error(self):
+        """Test validate reports non-parse exceptions as unexpected errors."""
+
+        def failing_parse(content):
+            raise KeyError("boom")
+
+        self.parser.parse = failing_parse
+        is_valid, error_info = self.parser.validate("anything")
+        assert is_valid is False
+        assert error_info["reason"] == "Unexpected error: KeyError"
+        assert error_info["line"] == 1
+
     def test_validate_from_file_valid(self):
         """Test validate_from_file returns True for valid file."""
         valid_content = """Class {
@@ -403,6 +432,24 @@ Class {
             finally:
                 os.unlink(f.name)
 
+    @pytest.mark.parametrize("threshold", [1, 1 << 20])
+    def test_parse_from_file_normalizes_newlines(self, monkeypatch, threshold):
+        """Test that plain and memory-mapped reads both translate CRLF."""
+        monkeypatch.setattr(
+            "tonel_smalltalk_parser.base_parser.MMAP_THRESHOLD", threshold
+        )
+        content = (
+            "Class {\r\n    #name : #Counter\r\n}\r\n\r\nCounter >> a [\r\n^ 1\r\n]"
+        )
+        with tempfile.NamedTemporaryFile(suffix=".st", delete=False) as f:
+            f.write(content.encode("utf-8"))
+        try:
+            result = self.parser.parse_from_file(f.name)
+        finally:
+            os.unlink(f.name)
+
+        assert result.methods[0].body == "\n^ 1\n"
+
     def test_validate_from_file_nonexistent(self):
         """Test validate_from_file returns False for nonexistent file."""
         assert self.parser.validate_from_file("/nonexistent/file.st")[0] is False